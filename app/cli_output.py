@@ -14,6 +14,11 @@ from typing import Any, Dict, List, Optional
 
 from app.planner_types import PlannerResult
 
+# Characters Telegram requires escaping, replaced in this order; chained
+# str.replace calls beat a single regex substitution here.
+_ESCAPE_PAIRS = tuple(("\\" + char, char) for char in r"\_*[]()~`>#+-=|{}.!$")
+_MD_LINK_RE = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+
 
 class OutputFormat(Enum):
     """Supported output formats."""
@@ -189,13 +194,13 @@ class CLIOutput:
         result = text
 
         # Remove backslash escapes (Telegram MarkdownV2)
-        # These are characters that Telegram requires escaping
-        escape_chars = r"\_*[]()~`>#+-=|{}.!$"
-        for char in escape_chars:
-            result = result.replace(f"\\{char}", char)
+        if "\\" in result:
+            for escaped, char in _ESCAPE_PAIRS:
+                result = result.replace(escaped, char)
 
         # Convert Markdown links to plain text: [text](url) -> text (url)
-        result = re.sub(r"\[([^\]]+)\]\(([^)]+)\)", r"\1 (\2)", result)
+        if "[" in result:
+            result = _MD_LINK_RE.sub(r"\1 (\2)", result)
 
         return result
 
@@ -7,11 +7,24 @@ from datetime import datetime
 from pathlib import Path
 from typing import AsyncGenerator
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from sqlmodel import Field, SQLModel
 
+# Pragmas applied to every new SQLite connection. WAL lets readers proceed
+# while a writer commits, and synchronous=NORMAL skips the per-commit fsync
+# of the rollback journal (still durable across application crashes).
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-20000",
+)
+
 
 class User(SQLModel, table=True):
     id: int | None = Field(default=None, primary_key=True)
@@ -35,7 +48,7 @@ class TokenContext(SQLModel, table=True):
     url: str | None = Field(default=None)
     chain_id: str | None = Field(default=None)
     saved_at: datetime = Field(default_factory=datetime.utcnow)
-    expires_at: datetime = Field(default_factory=datetime.utcnow)
+    expires_at: datetime = Field(default_factory=datetime.utcnow, index=True)
 
 
 class ConversationMessage(SQLModel, table=True):
@@ -53,8 +66,19 @@ class ConversationMessage(SQLModel, table=True):
 class Database:
     """Lightweight async database wrapper."""
 
-    def __init__(self, url: str) -> None:
+    def __init__(
+        self,
+        url: str,
+        pool_size: int = 25,
+        max_overflow: int = 0,
+        pool_pre_ping: bool = False,
+    ) -> None:
         self.url = url
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        # Pre-ping issues a ``SELECT 1`` on every checkout; only worth it for
+        # servers that drop idle connections, so it is opt-in.
+        self.pool_pre_ping = pool_pre_ping
         self._engine: AsyncEngine | None = None
         self._session_maker: sessionmaker | None = None
 
@@ -64,14 +88,27 @@ class Database:
             return
 
         url = make_url(self.url)
-        if url.get_backend_name() == "sqlite":
-            database = url.database
-            if database and database != ":memory:":
-                Path(database).expanduser().resolve().parent.mkdir(
-                    parents=True, exist_ok=True
-                )
-
-        self._engine = create_async_engine(self.url, echo=False, future=True)
+        is_sqlite = url.get_backend_name() == "sqlite"
+        in_memory = is_sqlite and url.database in (None, "", ":memory:")
+        if is_sqlite and not in_memory:
+            Path(url.database).expanduser().resolve().parent.mkdir(
+                parents=True, exist_ok=True
+            )
+
+        engine_options: dict = {"pool_pre_ping": self.pool_pre_ping}
+        if in_memory:
+            # Every connection must share the single in-memory database.
+            engine_options["poolclass"] = StaticPool
+            engine_options["connect_args"] = {"check_same_thread": False}
+        else:
+            engine_options["pool_size"] = self.pool_size
+            engine_options["max_overflow"] = self.max_overflow
+
+        self._engine = create_async_engine(
+            self.url, echo=False, future=True, **engine_options
+        )
+        if is_sqlite:
+            event.listen(self._engine.sync_engine, "connect", _apply_sqlite_pragmas)
         self._session_maker = sessionmaker(
             self._engine,
             class_=AsyncSession,
@@ -86,6 +123,13 @@ class Database:
         async with self._engine.begin() as conn:  # pragma: no cover - DDL
             await conn.run_sync(SQLModel.metadata.create_all)
 
+    async def dispose(self) -> None:
+        """Close pooled connections and release the engine."""
+        if self._engine:
+            await self._engine.dispose()
+            self._engine = None
+            self._session_maker = None
+
     @asynccontextmanager
     async def session(self) -> AsyncGenerator[AsyncSession, None]:
         """Return an async session context."""
@@ -96,6 +140,16 @@ class Database:
             yield session
 
 
+def _apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Tune each fresh SQLite connection for write-heavy workloads."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
 __all__ = [
     "Database",
     "User",
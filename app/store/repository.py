@@ -4,18 +4,33 @@ from __future__ import annotations
 
 import json
 import uuid
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
-from typing import Dict, Iterable, List, Optional
+from typing import AsyncIterator, Dict, Iterable, List, Optional
 
-from sqlalchemy import select, text
+from sqlalchemy import delete, insert, select, text
 
 from .db import ConversationMessage, TokenContext, User
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 TOKEN_CONTEXT_TTL_MINUTES = 60
 CONVERSATION_RETENTION_HOURS = 24
 CONVERSATION_SESSION_TIMEOUT_MINUTES = 30
 
 
+def _dumps(value: object) -> str | None:
+    """Serialise a JSON column value, storing empty values as NULL."""
+    if not value:
+        return None
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    return json.dumps(value)
+
+
 class Repository:
     """CRUD utilities wrapping SQLModel sessions."""
 
@@ -24,16 +39,40 @@ class Repository:
 
     _token_context_schema_ok: bool = False
 
+    @asynccontextmanager
+    async def _transaction(self) -> AsyncIterator[None]:
+        """Group the enclosed statements into one BEGIN/COMMIT.
+
+        Reuses a transaction autobegun by an earlier read on this session,
+        and rolls back if the block raises.
+        """
+        if not self.session.in_transaction():
+            async with self.session.begin():
+                yield
+            return
+
+        try:
+            yield
+        except BaseException:
+            await self.session.rollback()
+            raise
+        await self.session.commit()
+
     async def get_or_create_user(self, chat_id: int) -> User:
         result = await self.session.execute(select(User).where(User.chat_id == chat_id))
         user = result.scalar_one_or_none()
         if user:
             return user
 
-        user = User(chat_id=chat_id)
-        self.session.add(user)
-        await self.session.commit()
-        await self.session.refresh(user)
+        # RETURNING hands back the generated id with the INSERT itself, so no
+        # follow-up refresh SELECT is needed.
+        stmt = (
+            insert(User)
+            .values(chat_id=chat_id, created_at=datetime.utcnow())
+            .returning(User)
+        )
+        async with self._transaction():
+            user = (await self.session.scalars(stmt)).one()
         return user
 
     async def get_user_by_id(self, user_id: int) -> Optional[User]:
@@ -54,62 +93,62 @@ class Repository:
         now = datetime.utcnow()
         expires = now + timedelta(minutes=TOKEN_CONTEXT_TTL_MINUTES)
 
-        # Deduplicate input tokens by address
+        # Deduplicate input tokens by address, normalising once at write time so
+        # the primary-key lookup below never misses on checksum casing.
         tokens_by_addr = {}
         for t in tokens:
             addr = t.get("address")
             if addr and isinstance(addr, str):
-                tokens_by_addr[addr] = t
+                tokens_by_addr[self._normalize_address(addr)] = t
 
         if not tokens_by_addr:
             return
 
-        # Batch fetch existing
-        stmt = select(TokenContext).where(
-            TokenContext.user_id == user_id,
-            TokenContext.token_address.in_(tokens_by_addr.keys()),
-        )
-        result = await self.session.execute(stmt)
-        existing_records = {r.token_address: r for r in result.scalars().all()}
-
-        for address, entry in tokens_by_addr.items():
-            existing = existing_records.get(address)
-
-            symbol = entry.get("symbol") or ""
-            source = entry.get("source")
-            base_symbol = entry.get("baseSymbol")
-            token_name = entry.get("name")
-            pair_address = entry.get("pairAddress")
-            url = entry.get("url")
-            chain_id = entry.get("chainId")
-
-            if existing:
-                existing.symbol = symbol
-                existing.source = source
-                existing.base_symbol = base_symbol
-                existing.token_name = token_name
-                existing.pair_address = pair_address
-                existing.url = url
-                existing.chain_id = chain_id
-                existing.saved_at = now
-                existing.expires_at = expires
-            else:
-                ctx = TokenContext(
-                    user_id=user_id,
-                    token_address=address,
-                    symbol=symbol,
-                    source=source,
-                    base_symbol=base_symbol,
-                    token_name=token_name,
-                    pair_address=pair_address,
-                    url=url,
-                    chain_id=chain_id,
-                    saved_at=now,
-                    expires_at=expires,
-                )
-                self.session.add(ctx)
-
-        await self.session.commit()
+        async with self._transaction():
+            # Batch fetch existing
+            stmt = select(TokenContext).where(
+                TokenContext.user_id == user_id,
+                TokenContext.token_address.in_(tokens_by_addr.keys()),
+            )
+            result = await self.session.execute(stmt)
+            existing_records = {r.token_address: r for r in result.scalars().all()}
+
+            for address, entry in tokens_by_addr.items():
+                existing = existing_records.get(address)
+
+                symbol = entry.get("symbol") or ""
+                source = entry.get("source")
+                base_symbol = entry.get("baseSymbol")
+                token_name = entry.get("name")
+                pair_address = entry.get("pairAddress")
+                url = entry.get("url")
+                chain_id = entry.get("chainId")
+
+                if existing:
+                    existing.symbol = symbol
+                    existing.source = source
+                    existing.base_symbol = base_symbol
+                    existing.token_name = token_name
+                    existing.pair_address = pair_address
+                    existing.url = url
+                    existing.chain_id = chain_id
+                    existing.saved_at = now
+                    existing.expires_at = expires
+                else:
+                    ctx = TokenContext(
+                        user_id=user_id,
+                        token_address=address,
+                        symbol=symbol,
+                        source=source,
+                        base_symbol=base_symbol,
+                        token_name=token_name,
+                        pair_address=pair_address,
+                        url=url,
+                        chain_id=chain_id,
+                        saved_at=now,
+                        expires_at=expires,
+                    )
+                    self.session.add(ctx)
 
     async def list_active_token_context(self, user_id: int) -> Iterable[TokenContext]:
         """Return non-expired token context entries for a user."""
@@ -127,10 +166,12 @@ class Repository:
         """Delete token context rows that have expired."""
         await self._ensure_token_context_schema()
         now = datetime.utcnow()
-        await self.session.execute(
-            TokenContext.__table__.delete().where(TokenContext.expires_at <= now)
-        )
-        await self.session.commit()
+        async with self._transaction():
+            await self.session.execute(
+                delete(TokenContext)
+                .where(TokenContext.expires_at <= now)
+                .execution_options(synchronize_session=False)
+            )
 
     async def _ensure_token_context_schema(self) -> None:
         """Ensure base_symbol, pair_address columns exist on TokenContext."""
@@ -184,25 +225,27 @@ class Repository:
             role=role,
             content=content,
             session_id=session_id,
-            tool_calls=json.dumps(tool_calls) if tool_calls else None,
-            tokens_mentioned=json.dumps(tokens_mentioned) if tokens_mentioned else None,
+            tool_calls=_dumps(tool_calls),
+            tokens_mentioned=_dumps(tokens_mentioned),
             confidence=confidence,
         )
-        self.session.add(message)
-        await self.session.commit()
+        async with self._transaction():
+            self.session.add(message)
 
     async def get_conversation_history(
         self, user_id: int, limit: int = 10
     ) -> List[ConversationMessage]:
         """Retrieve recent conversation messages for a user."""
-        result = await self.session.execute(
+        result = await self.session.scalars(
             select(ConversationMessage)
             .where(ConversationMessage.user_id == user_id)
             .order_by(ConversationMessage.created_at.desc())
             .limit(limit)
         )
-        messages = list(result.scalars().all())
-        return list(reversed(messages))
+        # Newest-first from the query; flip in place to chronological order.
+        messages = result.all()
+        messages.reverse()
+        return messages
 
     async def get_or_create_session(self, user_id: int) -> str:
         """Get current session ID or create new one if timed out."""
@@ -227,12 +270,12 @@ class Repository:
     ) -> None:
         """Remove conversation messages older than retention period."""
         cutoff = datetime.utcnow() - timedelta(hours=retention_hours)
-        await self.session.execute(
-            ConversationMessage.__table__.delete().where(
-                ConversationMessage.created_at < cutoff
+        async with self._transaction():
+            await self.session.execute(
+                delete(ConversationMessage)
+                .where(ConversationMessage.created_at < cutoff)
+                .execution_options(synchronize_session=False)
             )
-        )
-        await self.session.commit()
 
     async def clear_conversation_history(self, user_id: int) -> int:
         """Delete all conversation messages for a user.
@@ -243,10 +286,10 @@ class Repository:
         Returns:
             Number of messages deleted
         """
-        result = await self.session.execute(
-            ConversationMessage.__table__.delete().where(
-                ConversationMessage.user_id == user_id
+        async with self._transaction():
+            result = await self.session.execute(
+                delete(ConversationMessage)
+                .where(ConversationMessage.user_id == user_id)
+                .execution_options(synchronize_session=False)
             )
-        )
-        await self.session.commit()
         return result.rowcount
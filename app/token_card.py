@@ -1,9 +1,41 @@
 """Token card formatter for consistent Telegram display."""
 
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 from app.utils.formatting import escape_markdown, escape_markdown_url
 
+# Static card fragments, escaped once at import so renders only escape the
+# dynamic values spliced into them.
+_PRICE_PREFIX = escape_markdown("💰 Price: $")
+_LIQ_PREFIX = escape_markdown("💧 Liq: $")
+_VOL_PREFIX = escape_markdown("📊 Vol: $")
+_METRIC_SEP = escape_markdown(" · ")
+_FDV_PREFIX = escape_markdown("📈 FDV: $")
+_MCAP_PREFIX = escape_markdown("📈 MCap: $")
+_POOL_PRICE_PREFIX = escape_markdown("💰 $")
+_DEX_LINK_OPEN = "[View on Dexscreener]("
+_BASE_DEX_LINK_PREFIX = _DEX_LINK_OPEN + escape_markdown_url(
+    "https://dexscreener.com/base/"
+)
+_DYOR = escape_markdown("⚠️ DYOR - Not financial advice")
+_NO_TOKENS = escape_markdown("No tokens found.")
+_NO_BOOSTED_TOKENS = escape_markdown("No boosted tokens found.")
+_NO_ACTIVITY = escape_markdown("No recent activity found.")
+_NO_SWAP_TOKENS = escape_markdown("No token data available for recent swaps.")
+
+# Honeypot verdict spellings seen across MCP server versions.
+_SAFE_VERDICTS = frozenset({"SAFE_TO_TRADE", "SAFE", "OK"})
+_CAUTION_VERDICTS = frozenset({"CAUTION", "WARNING"})
+_DANGER_VERDICTS = frozenset({"HONEYPOT", "DANGER", "DO_NOT_TRADE"})
+
+# (threshold, suffix) pairs for _format_number, largest first.
+_NUMBER_TIERS = (
+    (1_000_000_000, "B"),
+    (1_000_000, "M"),
+    (1_000, "K"),
+)
+
 
 def format_safety_badge(honeypot_data: Optional[Dict[str, Any]]) -> Optional[str]:
     """Format a compact safety badge from honeypot check result.
@@ -27,18 +59,19 @@ def format_safety_badge(honeypot_data: Optional[Dict[str, Any]]) -> Optional[str
     sell_tax = simulation.get("sellTax") or honeypot_data.get("sellTax")
 
     # Determine badge
-    if verdict in ("SAFE_TO_TRADE", "SAFE", "OK"):
+    if verdict in _SAFE_VERDICTS:
         badge = "✅ Safe"
-    elif verdict in ("CAUTION", "WARNING"):
-        badge = "⚠️ Caution"
+    elif verdict in _CAUTION_VERDICTS:
+        badge_parts = ["⚠️ Caution"]
         # Add reason if we have high tax
         if buy_tax and float(buy_tax) > 5:
-            badge += f" \\- Buy tax {buy_tax}%"
+            badge_parts += (" \\- Buy tax ", str(buy_tax), "%")
         elif sell_tax and float(sell_tax) > 5:
-            badge += f" \\- Sell tax {sell_tax}%"
+            badge_parts += (" \\- Sell tax ", str(sell_tax), "%")
         elif risk:
-            badge += f" \\- {escape_markdown(str(risk))}"
-    elif verdict in ("HONEYPOT", "DANGER", "DO_NOT_TRADE"):
+            badge_parts += (" \\- ", escape_markdown(str(risk)))
+        badge = "".join(badge_parts)
+    elif verdict in _DANGER_VERDICTS:
         badge = "🚨 Risk \\- Do not trade"
     else:
         badge = "❓ Unknown safety"
@@ -58,66 +91,77 @@ def format_token_card(
     Returns:
         Formatted Telegram MarkdownV2 message.
     """
+    return "\n".join(_token_card_lines(token_data, honeypot_data))
+
+
+def _token_card_lines(
+    token_data: Dict[str, Any], honeypot_data: Optional[Dict[str, Any]] = None
+) -> List[str]:
+    """Return the lines of a token card so list renderers can join once."""
+    # Bind the lookups once; a card reads a dozen fields.
+    get = token_data.get
+
     # Extract base token info
-    base_token = token_data.get("baseToken", {})
-    symbol = base_token.get("symbol") or token_data.get("symbol") or "TOKEN"
-    name = base_token.get("name") or token_data.get("name") or ""
-    address = base_token.get("address") or token_data.get("tokenAddress") or ""
+    base_token = get("baseToken", {})
+    base_get = base_token.get
+    symbol = base_get("symbol") or get("symbol") or "TOKEN"
+    name = base_get("name") or get("name") or ""
+    address = base_get("address") or get("tokenAddress") or ""
 
     # Price info
-    price_usd = token_data.get("priceUsd") or token_data.get("price") or "?"
-    price_change_24h = token_data.get("priceChange", {}).get("h24")
+    price_usd = get("priceUsd") or get("price") or "?"
+    price_change_24h = get("priceChange", {}).get("h24")
     if price_change_24h is None:
-        price_change_24h = token_data.get("change24h")
+        price_change_24h = get("change24h")
 
     # Liquidity and volume
-    liquidity = token_data.get("liquidity", {})
+    liquidity = get("liquidity", {})
     if isinstance(liquidity, dict):
         liquidity_usd = liquidity.get("usd")
     else:
         liquidity_usd = liquidity
 
-    volume_24h = token_data.get("volume", {}).get("h24")
+    volume_24h = get("volume", {}).get("h24")
     if volume_24h is None:
-        volume_24h = token_data.get("volume24h")
+        volume_24h = get("volume24h")
 
-    fdv = token_data.get("fdv")
-    market_cap = token_data.get("marketCap")
+    fdv = get("fdv")
+    market_cap = get("marketCap")
 
     # Links
-    dex_url = token_data.get("url") or ""
-    chain_id = token_data.get("chainId") or "base"
+    dex_url = get("url") or ""
+    chain_id = get("chainId") or "base"
 
     # Build card
     lines = []
 
     # Title line
-    title = f"*{escape_markdown(symbol)}*"
+    title_parts = ["*", escape_markdown(symbol), "*"]
     if name and name != symbol:
-        title += f" \\({escape_markdown(name)}\\)"
-    lines.append(title)
+        title_parts += (" \\(", escape_markdown(name), "\\)")
+    lines.append("".join(title_parts))
 
     # Price line with change
-    price_line = f"💰 Price: ${_format_number(price_usd)}"
+    price_parts = [_PRICE_PREFIX, escape_markdown(_format_number(price_usd))]
     if price_change_24h is not None:
         change_str = _format_change(price_change_24h)
-        price_line += f" {change_str}"
-    lines.append(escape_markdown(price_line))
+        price_parts += (" ", escape_markdown(change_str))
+    lines.append("".join(price_parts))
 
     # Metrics line
     metrics = []
     if liquidity_usd:
-        metrics.append(f"💧 Liq: ${_format_number(liquidity_usd)}")
+        metrics.append(_LIQ_PREFIX + escape_markdown(_format_number(liquidity_usd)))
     if volume_24h:
-        metrics.append(f"📊 Vol: ${_format_number(volume_24h)}")
+        metrics.append(_VOL_PREFIX + escape_markdown(_format_number(volume_24h)))
     if metrics:
-        lines.append(escape_markdown(" · ".join(metrics)))
+        lines.append(_METRIC_SEP.join(metrics))
 
     # FDV/Market cap
     if fdv:
-        lines.append(escape_markdown(f"📈 FDV: ${_format_number(fdv)}"))
+        lines.append(_FDV_PREFIX + escape_markdown(_format_number(fdv)))
     elif market_cap:
-        lines.append(escape_markdown(f"📈 MCap: ${_format_number(market_cap)}"))
+        lines.append(_MCAP_PREFIX + escape_markdown(_format_number(market_cap)))
 
     # Address (truncated)
     if address:
@@ -137,12 +181,16 @@ def format_token_card(
         safe_url = escape_markdown_url(dex_url)
         lines.append(f"[View on Dexscreener]({safe_url})")
     elif address:
-        # Construct URL
-        dex_link = f"https://dexscreener.com/{chain_id}/{address}"
-        safe_url = escape_markdown_url(dex_link)
-        lines.append(f"[View on Dexscreener]({safe_url})")
+        # Construct URL; Base is the common case, so its prefix is prebuilt.
+        if chain_id == "base":
+            prefix = _BASE_DEX_LINK_PREFIX
+        else:
+            prefix = _DEX_LINK_OPEN + escape_markdown_url(
+                f"https://dexscreener.com/{chain_id}/"
+            )
+        lines.append(prefix + escape_markdown_url(address) + ")")
 
-    return "\n".join(lines)
+    return lines
 
 
 def format_token_list(tokens: List[Dict[str, Any]], max_tokens: int = 5) -> str:
@@ -156,19 +204,21 @@ def format_token_list(tokens: List[Dict[str, Any]], max_tokens: int = 5) -> str:
         Formatted Telegram MarkdownV2 message.
     """
     if not tokens:
-        return escape_markdown("No tokens found.")
+        return _NO_TOKENS
 
-    cards = []
+    # One flat list with blank separator lines, joined a single time.
+    lines: List[str] = []
     for token in tokens[:max_tokens]:
-        cards.append(format_token_card(token))
-
-    result = "\n\n".join(cards)
+        lines.extend(_token_card_lines(token))
+        lines.append("")
 
     if len(tokens) > max_tokens:
         remaining = len(tokens) - max_tokens
-        result += f"\n\n_{escape_markdown(f'... and {remaining} more')}_"
+        lines.append(f"_{escape_markdown(f'... and {remaining} more')}_")
+    else:
+        lines.pop()
 
-    return result
+    return "\n".join(lines)
 
 
 def format_boosted_token(token: Dict[str, Any]) -> str:
@@ -275,7 +325,7 @@ def format_boosted_token_list(
         Formatted Telegram MarkdownV2 message.
     """
     if not tokens:
-        return escape_markdown("No boosted tokens found.")
+        return _NO_BOOSTED_TOKENS
 
     # Deduplicate by token address (boosted tokens can appear multiple times)
     seen = set()
@@ -312,22 +362,9 @@ def format_activity_summary(
         Formatted Telegram MarkdownV2 message.
     """
     if not transactions:
-        return escape_markdown("No recent activity found.")
-
-    # Count transaction types
-    swaps = 0
-    adds = 0
-    removes = 0
-
-    for tx in transactions:
-        method = (tx.get("method") or tx.get("function") or "").lower()
-        if "swap" in method:
-            swaps += 1
-        elif "add" in method:
-            adds += 1
-        elif "remove" in method:
-            removes += 1
+        return _NO_ACTIVITY
 
+    swaps, adds, removes = _count_activity(transactions)
     total = len(transactions)
 
     lines = []
@@ -341,16 +378,17 @@ def format_activity_summary(
     # Summary stats
     lines.append(escape_markdown(f"📊 {total} transactions in the last hour"))
 
-    breakdown = []
-    if swaps:
-        breakdown.append(f"🔄 {swaps} swaps")
-    if adds:
-        breakdown.append(f"➕ {adds} adds")
-    if removes:
-        breakdown.append(f"➖ {removes} removes")
-
+    breakdown = " · ".join(
+        part
+        for part in (
+            f"🔄 {swaps} swaps" if swaps else None,
+            f"➕ {adds} adds" if adds else None,
+            f"➖ {removes} removes" if removes else None,
+        )
+        if part
+    )
     if breakdown:
-        lines.append(escape_markdown(" · ".join(breakdown)))
+        lines.append(escape_markdown(breakdown))
 
     # Show a few recent transactions
     if transactions:
@@ -389,7 +427,11 @@ def format_swap_activity(
         Formatted Telegram MarkdownV2 message.
     """
     lines = []
-    honeypot_results = honeypot_results or {}
+    # Normalise keys once so per-token lookups below stay a single dict probe
+    # even when the caller keyed results by checksum addresses.
+    honeypot_results = {
+        key.lower(): value for key, value in (honeypot_results or {}).items()
+    }
 
     # Title
     title = f"🔄 *Recent {escape_markdown(router_name or 'DEX')} Swaps*"
@@ -401,31 +443,24 @@ def format_swap_activity(
         for token in tokens[:5]:
             # Get honeypot data for this token
             base_token = token.get("baseToken", {})
-            address = (
-                base_token.get("address") or token.get("tokenAddress") or ""
-            ).lower()
-            honeypot_data = honeypot_results.get(address)
+            address = base_token.get("address") or token.get("tokenAddress")
+            honeypot_data = honeypot_results.get(address.lower()) if address else None
 
-            card = format_token_card(token, honeypot_data)
-            lines.append(card)
+            lines.extend(_token_card_lines(token, honeypot_data))
             lines.append("")
     else:
-        lines.append(escape_markdown("No token data available for recent swaps."))
+        lines.append(_NO_SWAP_TOKENS)
         lines.append("")
 
     # Transaction summary
-    swap_count = sum(
-        1
-        for tx in transactions
-        if "swap" in (tx.get("method") or tx.get("function") or "").lower()
-    )
+    swap_count = _count_activity(transactions)[0]
 
     if swap_count > 0:
         lines.append(escape_markdown(f"📊 {swap_count} swaps in the last hour"))
 
     # Add disclaimer
     lines.append("")
-    lines.append(escape_markdown("⚠️ DYOR - Not financial advice"))
+    lines.append(_DYOR)
 
     return "\n".join(lines)
 
@@ -444,10 +479,10 @@ def format_safety_result(honeypot_data: Dict[str, Any]) -> str:
     risk = summary.get("risk") or honeypot_data.get("risk")
 
     # Verdict emoji
-    if verdict in ("SAFE_TO_TRADE", "SAFE", "OK"):
+    if verdict in _SAFE_VERDICTS:
         emoji = "✅"
         verdict_text = "SAFE TO TRADE"
-    elif verdict in ("CAUTION", "WARNING"):
+    elif verdict in _CAUTION_VERDICTS:
         emoji = "⚠️"
         verdict_text = "CAUTION"
     else:
@@ -492,7 +527,30 @@ def format_safety_result(honeypot_data: Dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
+def _count_activity(transactions: List[Dict[str, Any]]) -> Tuple[int, int, int]:
+    """Count (swaps, adds, removes) by method name in a single pass."""
+    swaps = adds = removes = 0
+    for tx in transactions:
+        if not (method := tx.get("method") or tx.get("function")):
+            continue
+        method = method.lower()
+        if "swap" in method:
+            swaps += 1
+        elif "add" in method:
+            adds += 1
+        elif "remove" in method:
+            removes += 1
+    return swaps, adds, removes
+
+
 def _format_number(value: Any) -> str:
+    """Format a number with K/M/B suffixes, memoising hashable inputs."""
+    if isinstance(value, _CACHEABLE_TYPES):
+        return _format_number_cached(value)
+    return _format_number_impl(value)
+
+
+def _format_number_impl(value: Any) -> str:
     """Format a number with K/M/B suffixes.
 
     Note: This function expects non-negative values (prices, volumes, etc.).
@@ -506,13 +564,10 @@ def _format_number(value: Any) -> str:
     except (ValueError, TypeError):
         return str(value)
 
-    if num >= 1_000_000_000:
-        return f"{num / 1_000_000_000:.2f}B"
-    elif num >= 1_000_000:
-        return f"{num / 1_000_000:.2f}M"
-    elif num >= 1_000:
-        return f"{num / 1_000:.2f}K"
-    elif num >= 1:
+    for threshold, suffix in _NUMBER_TIERS:
+        if num >= threshold:
+            return f"{num / threshold:.2f}{suffix}"
+    if num >= 1:
         return f"{num:.2f}"
     elif num >= 0.0001:
         return f"{num:.6f}"
@@ -521,6 +576,13 @@ def _format_number(value: Any) -> str:
 
 
 def _format_change(change: Any) -> str:
+    """Format a percentage change with emoji, memoising hashable inputs."""
+    if isinstance(change, _CACHEABLE_TYPES):
+        return _format_change_cached(change)
+    return _format_change_impl(change)
+
+
+def _format_change_impl(change: Any) -> str:
     """Format a percentage change with emoji."""
     try:
         pct = float(change)
@@ -535,6 +597,13 @@ def _format_change(change: Any) -> str:
         return "(→ 0%)"
 
 
+# Feeds re-render the same pool snapshots across polls, so the formatted
+# numbers repeat until the upstream data refreshes.
+_CACHEABLE_TYPES = (str, int, float, type(None))
+_format_number_cached = lru_cache(maxsize=2048, typed=True)(_format_number_impl)
+_format_change_cached = lru_cache(maxsize=2048, typed=True)(_format_change_impl)
+
+
 def format_pool_list(
     pools: List[Dict[str, Any]],
     network: str = "base",
@@ -578,12 +647,12 @@ def format_pool_list(
         lines.append(f"*{i}\\. {escape_markdown(pair)}* \\({escape_markdown(dex_name)}\\)")
 
         # Volume and price
-        vol_str = f"📊 Vol: ${_format_number(volume_usd)}"
-        price_str = f"💰 ${_format_number(price_usd)}"
+        vol_str = _VOL_PREFIX + escape_markdown(_format_number(volume_usd))
+        price_str = _POOL_PRICE_PREFIX + escape_markdown(_format_number(price_usd))
         if price_change_24h is not None:
             change_str = _format_change(price_change_24h)
-            price_str += f" {change_str}"
-        lines.append(escape_markdown(f"{vol_str} · {price_str}"))
+            price_str += " " + escape_markdown(change_str)
+        lines.append(vol_str + _METRIC_SEP + price_str)
 
         # Transactions
         lines.append(escape_markdown(f"🔄 {_format_number(txns)} txns (24h)"))
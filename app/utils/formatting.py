@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import List, Mapping, Sequence
 
 NOT_FINANCIAL_ADVICE = "All tokens can rug pull. DYOR, not financial advice"
@@ -17,21 +18,62 @@ SIGNAL_STRONG_THRESHOLD = 15.0
 SIGNAL_WATCH_THRESHOLD = 5.0
 
 
+# Characters Telegram MarkdownV2 requires to be backslash-escaped.
+MARKDOWN_SPECIAL_CHARS = r"_*[]()~`>#+-=|{}.!\\"
+
+# str.translate does the whole escape in a single C-level pass.
+_MARKDOWN_ESCAPE_TABLE = str.maketrans(
+    {char: "\\" + char for char in MARKDOWN_SPECIAL_CHARS}
+)
+
+# Hash lookup for the per-character unescape scan.
+_MARKDOWN_SPECIAL_SET = frozenset(MARKDOWN_SPECIAL_CHARS)
+
+# Inside link targets only backslashes and parentheses need escaping.
+_URL_ESCAPE_TABLE = str.maketrans({"\\": "\\\\", "(": "\\(", ")": "\\)"})
+
+# Longer strings (LLM replies, descriptions) are rarely repeated; keep them out
+# of the memo so it only holds short symbols and labels.
+_ESCAPE_CACHE_MAX_LEN = 256
+
+
 def escape_markdown(text: str) -> str:
     """Escape Telegram MarkdownV2 control characters."""
     if text is None:
-        text = ""
+        return ""
     if not isinstance(text, str):
         text = str(text)
-    special_chars = r"_*[]()~`>#+-=|{}.!\\"
-    return "".join(f"\\{char}" if char in special_chars else char for char in text)
+    if len(text) > _ESCAPE_CACHE_MAX_LEN:
+        return text.translate(_MARKDOWN_ESCAPE_TABLE)
+    return _escape_cached(text)
+
+
+@lru_cache(maxsize=4096)
+def _escape_cached(text: str) -> str:
+    """Escape ``text``, memoised for symbols and labels repeated across renders."""
+    return text.translate(_MARKDOWN_ESCAPE_TABLE)
+
+
+# Let callers (mainly tests) reset the memo without reaching into internals.
+escape_markdown.cache_clear = _escape_cached.cache_clear  # type: ignore[attr-defined]
+
+
+# The disclaimer never changes, so escape it once at import.
+_NFA_TEXT = escape_markdown(NOT_FINANCIAL_ADVICE)
+_NFA_FOOTER = "\n\n" + _NFA_TEXT
 
 
 def escape_markdown_url(url: str) -> str:
     """Escape Telegram MarkdownV2-sensitive characters inside link URLs."""
     if not url:
         return ""
-    return url.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+    return _escape_url_cached(url)
+
+
+@lru_cache(maxsize=512)
+def _escape_url_cached(url: str) -> str:
+    """Escape a link URL, memoised for links re-rendered across polls."""
+    return url.translate(_URL_ESCAPE_TABLE)
 
 
 def format_transaction(entry: Mapping[str, str]) -> str:
@@ -42,16 +84,16 @@ def format_transaction(entry: Mapping[str, str]) -> str:
     tx_hash = entry.get("hash", "")
     explorer = entry.get("explorer_url")
 
-    summary = f"• {escape_markdown(timestamp)} — {escape_markdown(fn)}"
+    parts = [f"• {escape_markdown(timestamp)} — {escape_markdown(fn)}"]
     if amount:
-        summary += f" \\({escape_markdown(amount)}\\)"
+        parts.append(f" \\({escape_markdown(amount)}\\)")
     if explorer:
-        summary += (
+        parts.append(
             f" — [{escape_markdown(tx_hash[:8] + '…')}]({escape_markdown(explorer)})"
         )
     else:
-        summary += f" — {escape_markdown(tx_hash)}"
-    return summary
+        parts.append(f" — {escape_markdown(tx_hash)}")
+    return "".join(parts)
 
 
 def format_token_summary(entry: Mapping[str, str]) -> str:
@@ -67,40 +109,44 @@ def format_token_summary(entry: Mapping[str, str]) -> str:
     change_pct = _parse_percentage(change)
     signal_tag = _classify_change(change_pct)
 
-    title = f"*{escape_markdown(ticker)}*"
+    # Everything after the bold ticker is plain text, so escape it in one pass.
+    title_rest = ""
     if name and name != ticker:
-        title += f" \\({escape_markdown(name)}\\)"
+        title_rest = f" ({name})"
     if signal_tag:
-        title += f" · {escape_markdown(signal_tag)}"
+        title_rest = f"{title_rest} · {signal_tag}"
+    title = f"*{escape_markdown(ticker)}*{escape_markdown(title_rest)}"
 
     risk_line = format_honeypot_verdict(
         entry.get("riskVerdict"), entry.get("riskReason")
     )
 
-    price_line = f"Price: {escape_markdown(price)}"
+    # Price, metrics and info lines carry no markup; build them raw and escape
+    # the whole block once.
+    price_line = f"Price: {price}"
     if change and change != "?":
-        price_line += f" \\(24h {escape_markdown(change)}\\)"
+        price_line = f"{price_line} (24h {change})"
+    body: List[str] = [price_line]
 
     metrics: List[str] = []
     if volume and volume != "?":
-        metrics.append(f"Vol {escape_markdown(volume)}")
+        metrics.append(f"Vol {volume}")
     if liquidity and liquidity != "?":
-        metrics.append(f"Liq {escape_markdown(liquidity)}")
+        metrics.append(f"Liq {liquidity}")
     if fdv and fdv != "?":
-        metrics.append(f"FDV {escape_markdown(fdv)}")
-    metrics_line = " · ".join(metrics)
+        metrics.append(f"FDV {fdv}")
+    if metrics:
+        body.append(" · ".join(metrics))
 
     activity_summary = entry.get("activitySummary")
     activity_details = entry.get("activityDetails")
+    if activity_summary:
+        body.append(f"Info: {activity_summary}")
 
     lines: List[str] = [title]
     if risk_line:
         lines.append(risk_line)
-    lines.append(price_line)
-    if metrics_line:
-        lines.append(metrics_line)
-    if activity_summary:
-        lines.append(f"Info: {escape_markdown(activity_summary)}")
+    lines.append(escape_markdown("\n".join(body)))
     if activity_details:
         lines.append(activity_details)
     if link:
@@ -126,6 +172,7 @@ def format_honeypot_verdict(
     return text
 
 
+@lru_cache(maxsize=1024)
 def _parse_percentage(value: str | None) -> float | None:
     """Convert percent strings like '12.3%' to a float."""
     if not value or value == "?":
@@ -161,20 +208,22 @@ def append_not_financial_advice(message: str) -> str:
     """Ensure the output ends with the NFA footer."""
     trimmed = message.strip()
     if not trimmed:
-        return escape_markdown(NOT_FINANCIAL_ADVICE)
-    footer = f"\n\n{escape_markdown(NOT_FINANCIAL_ADVICE)}"
-    return trimmed + footer
+        return _NFA_TEXT
+    return trimmed + _NFA_FOOTER
 
 
 def unescape_markdown(text: str) -> str:
     """Remove MarkdownV2 escape characters for plain text display."""
     if not text:
         return ""
-    special_chars = "_*[]()~`>#+-=|{}.!\\"
     result = []
     i = 0
     while i < len(text):
-        if i < len(text) - 1 and text[i] == "\\" and text[i + 1] in special_chars:
+        if (
+            i < len(text) - 1
+            and text[i] == "\\"
+            and text[i + 1] in _MARKDOWN_SPECIAL_SET
+        ):
             result.append(text[i + 1])
             i += 2
         else:
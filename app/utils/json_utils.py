@@ -4,6 +4,14 @@ import json
 import re
 from typing import Any, Dict
 
+try:
+    from orjson import loads as _loads
+except ImportError:  # pragma: no cover - optional speedup
+    from json import loads as _loads
+
+# 'key': -> "key": for LLMs that fall back to Python dict syntax.
+_SINGLE_QUOTE_KEY_RE = re.compile(r"'(\w+)'(\s*:)")
+
 
 def parse_llm_json(text: str) -> Dict[str, Any]:
     """
@@ -18,29 +26,40 @@ def parse_llm_json(text: str) -> Dict[str, Any]:
     Raises:
         json.JSONDecodeError: If the text cannot be parsed as JSON.
     """
+    # Fenced replies can never parse as-is, so skip the doomed first attempt.
+    if not text.lstrip().startswith("```"):
+        try:
+            return _loads(text)
+        except json.JSONDecodeError:
+            pass
+
+    # Robust cleanup for markdown code blocks
+    cleaned = _strip_code_fence(text)
     try:
-        return json.loads(text)
+        return _loads(cleaned)
     except json.JSONDecodeError:
-        # Robust cleanup for markdown code blocks
-        cleaned = text.strip()
-        if cleaned.startswith("```json"):
-            cleaned = cleaned[7:]
-        if cleaned.endswith("```"):
-            cleaned = cleaned[:-3]
-        cleaned = cleaned.strip()
+        # Try to fix common LLM JSON mistakes
+        fixed = _fix_common_json_errors(cleaned)
         try:
-            return json.loads(cleaned)
-        except json.JSONDecodeError:
-            # Try to fix common LLM JSON mistakes
-            fixed = _fix_common_json_errors(cleaned)
-            try:
-                return json.loads(fixed)
-            except json.JSONDecodeError as e:
-                # Include cleaned text preview in error for debugging
-                preview = cleaned[:100] + "..." if len(cleaned) > 100 else cleaned
-                raise json.JSONDecodeError(
-                    f"Failed to parse LLM JSON. Preview: {preview}", e.doc, e.pos
-                ) from e
+            return json.loads(fixed)
+        except json.JSONDecodeError as e:
+            # Include cleaned text preview in error for debugging
+            preview = cleaned[:100] + "..." if len(cleaned) > 100 else cleaned
+            raise json.JSONDecodeError(
+                f"Failed to parse LLM JSON. Preview: {preview}", e.doc, e.pos
+            ) from e
+
+
+def _strip_code_fence(text: str) -> str:
+    """Strip an opening ```/```json fence and a closing ``` fence."""
+    cleaned = text.strip()
+    if cleaned.startswith("```"):
+        cleaned = cleaned[3:]
+        if cleaned.startswith("json"):
+            cleaned = cleaned[4:]
+    if cleaned.endswith("```"):
+        cleaned = cleaned[:-3]
+    return cleaned.strip()
 
 
 def _fix_common_json_errors(text: str) -> str:
@@ -50,20 +69,8 @@ def _fix_common_json_errors(text: str) -> str:
     - Unescaped quotes inside string values
     - Single quotes instead of double quotes
     """
-
-    # Try to fix unescaped quotes in string values
-    # This regex finds string values and escapes internal quotes
-    # Pattern: match content between "key": " and the closing "
-    def escape_inner_quotes(match):
-        content = match.group(1)
-        # Escape any unescaped quotes inside the string
-        escaped = content.replace('\\"', "__ESCAPED_QUOTE__")
-        escaped = escaped.replace('"', '\\"')
-        escaped = escaped.replace("__ESCAPED_QUOTE__", '\\"')
-        return f'"{escaped}"'
-
     # Replace single quotes with double quotes for keys and simple values
-    text = re.sub(r"'(\w+)'(\s*:)", r'"\1"\2', text)
+    text = _SINGLE_QUOTE_KEY_RE.sub(r'"\1"\2', text)
 
     # Try to find and fix unescaped quotes in values
     # This is a best-effort fix for patterns like "key": "value with "quotes" inside"
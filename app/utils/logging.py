@@ -2,13 +2,58 @@
 
 from __future__ import annotations
 
+import atexit
+import json
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import structlog
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+LOG_FILE_MAX_BYTES = 10_000_000
+LOG_FILE_BACKUP_COUNT = 3
+
+# Background thread that drains queued records into the real handlers.
+_listener: Optional[QueueListener] = None
+
+# (level, log_file, console) of the active configuration, to skip no-op reconfigures.
+_current_config: Optional[Tuple[str, Optional[str], bool]] = None
+
+
+class _RecordQueueHandler(QueueHandler):
+    """Enqueue records untouched so ProcessorFormatter still sees the event dict."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def _stop_listener() -> None:
+    """Flush queued records and stop the background listener."""
+    global _current_config, _listener
+    _current_config = None
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(_stop_listener)
+
+
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """Serialise a log event with orjson, deferring to json for what it rejects."""
+    try:
+        return orjson.dumps(obj, default=kwargs.get("default")).decode()
+    except TypeError:  # non-str keys, ints beyond 64 bits
+        return json.dumps(obj, **kwargs)
+
 
 def configure_logging(
     level: str = "INFO",
@@ -22,6 +67,11 @@ def configure_logging(
         log_file: Optional path to write logs to file.
         console: Whether to output logs to console (default True).
     """
+    global _current_config, _listener
+    fingerprint = (level.upper(), str(log_file) if log_file else None, console)
+    if fingerprint == _current_config:
+        return
+
     log_level = getattr(logging, level.upper(), logging.INFO)
 
     # Configure root logger
@@ -29,35 +79,56 @@ def configure_logging(
     root_logger.setLevel(log_level)
 
     # Clear existing handlers
+    _stop_listener()
     root_logger.handlers.clear()
 
     # Create formatter for structlog
     formatter = structlog.stdlib.ProcessorFormatter(
-        processor=structlog.processors.JSONRenderer(),
+        processor=(
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps)
+            if orjson is not None
+            else structlog.processors.JSONRenderer()
+        ),
         foreign_pre_chain=[
             structlog.stdlib.add_log_level,
             structlog.processors.TimeStamper(fmt="iso"),
         ],
     )
 
+    handlers: list[logging.Handler] = []
+
     # Add console handler if enabled
     if console:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(log_level)
         console_handler.setFormatter(formatter)
-        root_logger.addHandler(console_handler)
+        handlers.append(console_handler)
 
     # Add file handler if specified
     if log_file:
         log_file.parent.mkdir(parents=True, exist_ok=True)
-        file_handler = logging.FileHandler(log_file, mode="w")
+        file_handler = RotatingFileHandler(
+            log_file,
+            maxBytes=LOG_FILE_MAX_BYTES,
+            backupCount=LOG_FILE_BACKUP_COUNT,
+            delay=True,
+        )
         file_handler.setLevel(log_level)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    # Formatting and I/O happen on the listener thread, off the caller's path
+    if handlers:
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+        root_logger.addHandler(_RecordQueueHandler(log_queue))
 
     # Configure structlog to route through stdlib logging
     structlog.configure(
         processors=[
+            # Drop records below the level before any timestamp/stack work
+            structlog.stdlib.filter_by_level,
             structlog.stdlib.add_log_level,
             structlog.stdlib.PositionalArgumentsFormatter(),
             structlog.processors.TimeStamper(fmt="iso"),
@@ -70,6 +141,7 @@ def configure_logging(
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=False,  # Allow reconfiguration
     )
+    _current_config = fingerprint
 
 
 def get_logger(name: str) -> "structlog.stdlib.BoundLogger":
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -16,8 +17,8 @@ def load_prompt_template(path: Optional[Path]) -> Optional[str]:
         return None
 
     try:
-        content = path.read_text(encoding="utf-8")
-        return content.strip()
+        # stat() is cheap; the mtime in the key invalidates edited templates.
+        return _read_template(str(path), path.stat().st_mtime_ns)
     except FileNotFoundError:
         logger.warning("prompt_template_missing", path=str(path))
     except OSError as exc:  # pragma: no cover - filesystem issues
@@ -25,4 +26,10 @@ def load_prompt_template(path: Optional[Path]) -> Optional[str]:
     return None
 
 
+@lru_cache(maxsize=32)
+def _read_template(path: str, mtime_ns: int) -> str:
+    """Read and strip a template, memoised per file version."""
+    return Path(path).read_text(encoding="utf-8").strip()
+
+
 __all__ = ["load_prompt_template"]
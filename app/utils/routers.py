@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
-import json
 import re
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 
-DEFAULT_ROUTERS: Dict[str, Dict[str, str]] = {
+try:
+    from orjson import loads as _loads
+except ImportError:  # pragma: no cover - optional speedup
+    from json import loads as _loads
+
+_RAW_DEFAULT_ROUTERS: Dict[str, Dict[str, str]] = {
     "aerodrome_v2": {
         "base-mainnet": "0xcF77a3Ba9A5CA399B7c97c74d54e5b1Beb874E43",
         "base-sepolia": "0x0000000000000000000000000000000000000000",
@@ -39,6 +46,25 @@ DEFAULT_ROUTERS: Dict[str, Dict[str, str]] = {
     },
 }
 
+# Read-only view so callers can share the defaults without defensive copies.
+DEFAULT_ROUTERS: Mapping[str, Mapping[str, str]] = MappingProxyType(
+    {key: MappingProxyType(networks) for key, networks in _RAW_DEFAULT_ROUTERS.items()}
+)
+
+# Same table with addresses lowercased once, for comparing against on-chain data.
+# Interned so equality checks against other interned copies hit the identity path.
+DEFAULT_ROUTERS_LOWER: Mapping[str, Mapping[str, str]] = MappingProxyType(
+    {
+        key: MappingProxyType(
+            {
+                network: sys.intern(address.lower())
+                for network, address in networks.items()
+            }
+        )
+        for key, networks in _RAW_DEFAULT_ROUTERS.items()
+    }
+)
+
 # Display names for each router
 ROUTER_DISPLAY_NAMES: Dict[str, str] = {
     "aerodrome_v2": "Aerodrome V2",
@@ -92,8 +118,16 @@ ROUTER_ALIAS_GROUPS: Dict[str, List[str]] = {
     "sushiswap_v2": ["sushi", "sushiswap"],
 }
 
+# Aliases sorted by length (longest first) to match more specific aliases first,
+# e.g. "uniswap v3" should match before "uniswap". Sorted once at import.
+_ALIASES_LONGEST_FIRST: Tuple[Tuple[str, str], ...] = tuple(
+    sorted(ROUTER_ALIASES.items(), key=lambda item: len(item[0]), reverse=True)
+)
+
+_VERSION_RE = re.compile(r"v(\d)")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class RouterInfo:
     """Metadata describing a known router."""
 
@@ -102,7 +136,23 @@ class RouterInfo:
     address: str
 
 
-def load_router_map(path: Optional[Path] = None) -> Dict[str, Dict[str, str]]:
+def _build_router_infos(
+    routers: Mapping[str, Mapping[str, str]],
+) -> Dict[Tuple[str, str], RouterInfo]:
+    """Index RouterInfo instances by (key, network) for routers with an address."""
+    return {
+        (key, network): RouterInfo(key=key, network=network, address=address)
+        for key, networks in routers.items()
+        for network, address in networks.items()
+        if address
+    }
+
+
+_DEFAULT_ROUTER_INFOS = _build_router_infos(DEFAULT_ROUTERS)
+_DEFAULT_ROUTER_INFOS_LOWER = _build_router_infos(DEFAULT_ROUTERS_LOWER)
+
+
+def load_router_map(path: Optional[Path] = None) -> Mapping[str, Mapping[str, str]]:
     """Load routers from JSON file or fall back to defaults."""
     if path is None:
         return DEFAULT_ROUTERS
@@ -110,24 +160,30 @@ def load_router_map(path: Optional[Path] = None) -> Dict[str, Dict[str, str]]:
     if not path.exists():
         raise FileNotFoundError(f"Router configuration not found: {path}")
 
-    with path.open("r", encoding="utf-8") as handle:
-        data = json.load(handle)
-
-    routers: Dict[str, Dict[str, str]] = {}
-    for key, networks in data.items():
-        routers[key] = {}
-        for network, address in networks.items():
-            routers[key][network] = address
+    data = _loads(path.read_bytes())
+    if not isinstance(data, dict):
+        raise ValueError(f"Router configuration must be a JSON object: {path}")
 
-    return routers
+    return {key: MappingProxyType(networks) for key, networks in data.items()}
 
 
 def resolve_router(
     router_key: str,
     network: str,
-    routers: Dict[str, Dict[str, str]],
+    routers: Mapping[str, Mapping[str, str]],
+    lower: bool = False,
 ) -> RouterInfo:
-    """Return router metadata for the requested key/network."""
+    """Return router metadata for the requested key/network.
+
+    With ``lower=True`` the address is returned lowercased. Lookups against
+    ``DEFAULT_ROUTERS`` return shared prebuilt instances.
+    """
+    if routers is DEFAULT_ROUTERS:
+        infos = _DEFAULT_ROUTER_INFOS_LOWER if lower else _DEFAULT_ROUTER_INFOS
+        info = infos.get((router_key, network))
+        if info is not None:
+            return info
+
     network_map = routers.get(router_key)
     if not network_map:
         raise KeyError(f"Unknown router key: {router_key}")
@@ -135,6 +191,8 @@ def resolve_router(
     address = network_map.get(network)
     if not address:
         raise KeyError(f"Router '{router_key}' has no address for network '{network}'")
+    if lower:
+        address = address.lower()
 
     return RouterInfo(key=router_key, network=network, address=address)
 
@@ -148,25 +206,24 @@ def match_router_name(user_input: str) -> Optional[str]:
     Returns:
         Router key (e.g., "uniswap_v2") or None if no match.
     """
-    lower_input = user_input.lower()
+    return _match_router_name(user_input.lower())
 
-    # Sort aliases by length (longest first) to match more specific aliases first
-    # e.g., "uniswap v3" should match before "uniswap"
-    sorted_aliases = sorted(ROUTER_ALIASES.items(), key=lambda x: len(x[0]), reverse=True)
 
-    for alias, key in sorted_aliases:
+@lru_cache(maxsize=1024)
+def _match_router_name(lower_input: str) -> Optional[str]:
+    """Resolve already-lowercased input; memoised for repeated prompts."""
+    for alias, key in _ALIASES_LONGEST_FIRST:
         if alias in lower_input:
             return key
 
     # Try matching base router name with version extraction
-    version_match = re.search(r"v(\d)", lower_input)
-    version = f"_v{version_match.group(1)}" if version_match else "_v2"
-
     for base_name in ["uniswap", "aerodrome", "pancakeswap", "sushiswap", "pancake"]:
         if base_name in lower_input:
             # Handle pancake -> pancakeswap
             if base_name == "pancake":
                 base_name = "pancakeswap"
+            version_match = _VERSION_RE.search(lower_input)
+            version = f"_v{version_match.group(1)}" if version_match else "_v2"
             candidate = f"{base_name}{version}"
             if candidate in DEFAULT_ROUTERS:
                 return candidate
@@ -185,13 +242,22 @@ def list_routers(network: str = "base-mainnet") -> List[Tuple[str, str, str]]:
     Returns:
         List of (key, display_name, address) tuples for active routers.
     """
-    result = []
+    return list(_ROUTER_LISTINGS.get(network, ()))
+
+
+def _build_router_listings() -> Dict[str, Tuple[Tuple[str, str, str], ...]]:
+    """Precompute list_routers output for every network in the defaults."""
+    listings: Dict[str, List[Tuple[str, str, str]]] = {}
     for key, networks in DEFAULT_ROUTERS.items():
-        address = networks.get(network)
-        if address and address != "0x0000000000000000000000000000000000000000":
-            display_name = ROUTER_DISPLAY_NAMES.get(key, key)
-            result.append((key, display_name, address))
-    return result
+        for network, address in networks.items():
+            listings.setdefault(network, [])
+            if address and address != "0x0000000000000000000000000000000000000000":
+                display_name = ROUTER_DISPLAY_NAMES.get(key, key)
+                listings[network].append((key, display_name, address))
+    return {network: tuple(rows) for network, rows in listings.items()}
+
+
+_ROUTER_LISTINGS = _build_router_listings()
 
 
 def get_router_display_name(router_key: str) -> str:
@@ -1,7 +1,9 @@
 """Transaction parsing utilities for extracting token addresses from swaps."""
 
 import re
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
+
+from app.utils.routers import DEFAULT_ROUTERS_LOWER
 
 
 # Common Uniswap V2/V3 swap method signatures
@@ -25,6 +27,29 @@ SWAP_METHODS = {
 
 # Address pattern
 ADDRESS_PATTERN = re.compile(r"0x[a-fA-F0-9]{40}")
+_is_address = ADDRESS_PATTERN.fullmatch
+
+# 32-byte ABI word holding an address: 24 zero nibbles + 40 hex chars.
+# Applied to lowercased data, so the class only needs lowercase hex.
+_PADDED_ADDR_RE = re.compile(r"0{24}([0-9a-f]{40})", re.ASCII)
+
+# Common parameter names for token addresses in decoded input
+_TOKEN_PARAMS = frozenset({"path", "tokenIn", "tokenOut", "token0", "token1", "token"})
+
+# Common addresses to exclude (null address, WETH, every known router)
+_EXCLUDED_ADDRESSES = frozenset(
+    {
+        "0x0000000000000000000000000000000000000000",  # Null
+        "0x4200000000000000000000000000000000000006",  # Base WETH
+    }
+).union(
+    address
+    for networks in DEFAULT_ROUTERS_LOWER.values()
+    for address in networks.values()
+)
+
+# Prefix of an address with more than 16 leading zero nibbles.
+_TOO_MANY_LEADING_ZEROS = "0" * 17
 
 
 def extract_tokens_from_transactions(transactions: List[Dict[str, Any]]) -> List[str]:
@@ -36,167 +61,177 @@ def extract_tokens_from_transactions(transactions: List[Dict[str, Any]]) -> List
     Returns:
         List of unique token addresses found in the transactions.
     """
-    addresses: Set[str] = set()
+    return list(iter_tokens_from_transactions(transactions))
 
+
+def iter_tokens_from_transactions(
+    transactions: Iterable[Dict[str, Any]],
+) -> Iterator[str]:
+    """Yield unique token addresses transaction by transaction.
+
+    Lets callers that only need the first few tokens stop early instead of
+    parsing the whole batch.
+    """
+    seen: Set[str] = set()
     for tx in transactions:
-        # Extract addresses from decoded input (various field names)
-        decoded = (
-            tx.get("decoded_input")
-            or tx.get("decodedInput")
-            or tx.get("decoded")
-            or tx.get("decodedMethod")
-            or tx.get("parameters")
-            or {}
-        )
-        if isinstance(decoded, dict):
-            addresses.update(_extract_addresses_from_decoded(decoded))
-            # Check params inside decodedMethod
-            if decoded.get("params"):
-                for param in decoded["params"]:
-                    if isinstance(param, dict):
-                        addresses.update(_extract_addresses_from_decoded(param))
-
-        # Also check if decoded is in a nested 'result' field
-        if isinstance(tx.get("result"), dict):
-            addresses.update(_extract_addresses_from_decoded(tx["result"]))
-
-        # Extract from raw input data if available (check rawInput too!)
-        raw_input = (
-            tx.get("rawInput")
-            or tx.get("input")
-            or tx.get("raw_input")
-            or tx.get("data")
-            or ""
-        )
-        if raw_input and len(raw_input) > 10:
-            addresses.update(_extract_addresses_from_raw(raw_input))
-
-        # Extract from token transfers in the transaction (various field names)
-        transfers = (
-            tx.get("token_transfers")
-            or tx.get("tokenTransfers")
-            or tx.get("transfers")
-            or []
+        found = _addresses_from_transaction(tx) - seen
+        seen |= found
+        # Filter out common non-token addresses (routers, WETH, etc.)
+        yield from _token_addresses(found)
+
+
+def _addresses_from_transaction(tx: Dict[str, Any]) -> Set[str]:
+    """Collect every lowercase candidate address referenced by ``tx``."""
+    addresses: Set[str] = set()
+    raw_blobs: List[str] = []
+
+    # Extract addresses from decoded input (various field names)
+    decoded = (
+        tx.get("decoded_input")
+        or tx.get("decodedInput")
+        or tx.get("decoded")
+        or tx.get("decodedMethod")
+        or tx.get("parameters")
+        or {}
+    )
+    if isinstance(decoded, dict):
+        addresses.update(_extract_addresses_from_decoded(decoded))
+        # Check params inside decodedMethod
+        if decoded.get("params"):
+            for param in decoded["params"]:
+                if isinstance(param, dict):
+                    addresses.update(_extract_addresses_from_decoded(param))
+
+    # Also check if decoded is in a nested 'result' field
+    if isinstance(tx.get("result"), dict):
+        addresses.update(_extract_addresses_from_decoded(tx["result"]))
+
+    # Extract from raw input data if available (check rawInput too!)
+    raw_input = (
+        tx.get("rawInput")
+        or tx.get("input")
+        or tx.get("raw_input")
+        or tx.get("data")
+        or ""
+    )
+    if raw_input and len(raw_input) > 10:
+        raw_blobs.append(raw_input)
+
+    # Extract from token transfers in the transaction (various field names)
+    transfers = (
+        tx.get("token_transfers")
+        or tx.get("tokenTransfers")
+        or tx.get("transfers")
+        or []
+    )
+    for transfer in transfers:
+        token_addr = (
+            transfer.get("token_address")
+            or transfer.get("tokenAddress")
+            or transfer.get("token", {}).get("address")
+            or transfer.get("address")
         )
-        for transfer in transfers:
-            token_addr = (
-                transfer.get("token_address")
-                or transfer.get("tokenAddress")
-                or transfer.get("token", {}).get("address")
-                or transfer.get("address")
-            )
-            if token_addr:
-                addresses.add(token_addr.lower())
-
-            # Also check nested token object
-            token_obj = transfer.get("token", {})
-            if isinstance(token_obj, dict) and token_obj.get("address"):
-                addresses.add(token_obj["address"].lower())
-
-        # Extract from logs if available
-        logs = tx.get("logs") or tx.get("receipt", {}).get("logs") or []
-        for log in logs:
-            # Transfer event topic
-            if log.get("topics") and len(log["topics"]) > 0:
-                # Look for addresses in log data
-                log_data = log.get("data") or ""
-                addresses.update(_extract_addresses_from_raw(log_data))
-
-            # Also check log address (contract that emitted the event)
-            log_addr = log.get("address")
-            if log_addr and ADDRESS_PATTERN.match(log_addr):
-                addresses.add(log_addr.lower())
-
-    # Filter out common non-token addresses (routers, WETH, etc.)
-    filtered = _filter_addresses(addresses)
-
-    return list(filtered)
+        if token_addr:
+            addresses.add(token_addr.lower())
+
+        # Also check nested token object
+        token_obj = transfer.get("token", {})
+        if isinstance(token_obj, dict) and token_obj.get("address"):
+            addresses.add(token_obj["address"].lower())
+
+    # Extract from logs if available
+    logs = tx.get("logs") or tx.get("receipt", {}).get("logs") or []
+    for log in logs:
+        # Transfer event topic
+        if log.get("topics") and len(log["topics"]) > 0:
+            # Look for addresses in log data
+            log_data = log.get("data") or ""
+            raw_blobs.append(log_data)
+
+        # Also check log address (contract that emitted the event)
+        log_addr = log.get("address")
+        if log_addr and _is_address(log_addr):
+            addresses.add(log_addr.lower())
+
+    # Scan raw input and log data in one regex pass
+    if raw_blobs:
+        addresses.update(_extract_addresses_from_raw(raw_blobs))
+
+    return addresses
 
 
 def _extract_addresses_from_decoded(decoded: Dict[str, Any]) -> Set[str]:
     """Extract addresses from decoded transaction input."""
     addresses: Set[str] = set()
-
-    # Common parameter names for token addresses
-    token_params = {"path", "tokenIn", "tokenOut", "token0", "token1", "token"}
-
-    for key, value in decoded.items():
-        if key in token_params:
-            if isinstance(value, str) and ADDRESS_PATTERN.match(value):
-                addresses.add(value.lower())
+    token_params = _TOKEN_PARAMS
+    is_address = _is_address
+
+    # Walk nested objects with an explicit stack instead of recursing per dict
+    stack: List[Dict[str, Any]] = [decoded]
+    while stack:
+        node = stack.pop()
+        for key, value in node.items():
+            if key in token_params:
+                if isinstance(value, str) and is_address(value):
+                    addresses.add(value.lower())
+                elif isinstance(value, list):
+                    for item in value:
+                        if isinstance(item, str) and is_address(item):
+                            addresses.add(item.lower())
+
+            # Queue nested objects
+            if isinstance(value, dict):
+                stack.append(value)
             elif isinstance(value, list):
                 for item in value:
-                    if isinstance(item, str) and ADDRESS_PATTERN.match(item):
-                        addresses.add(item.lower())
-
-        # Recursively check nested objects
-        if isinstance(value, dict):
-            addresses.update(_extract_addresses_from_decoded(value))
-        elif isinstance(value, list):
-            for item in value:
-                if isinstance(item, dict):
-                    addresses.update(_extract_addresses_from_decoded(item))
+                    if isinstance(item, dict):
+                        stack.append(item)
 
     return addresses
 
 
-def _extract_addresses_from_raw(data: str) -> Set[str]:
-    """Extract addresses from raw hex data."""
-    addresses: Set[str] = set()
-
+def _extract_addresses_from_raw(blobs: List[str]) -> Set[str]:
+    """Extract addresses from a batch of raw hex data strings."""
     # Find all 40-character hex sequences that could be addresses
     # In raw data, addresses are often padded to 32 bytes (64 chars)
     # Look for patterns like 000000000000000000000000{40-char-address}
 
-    if not data.startswith("0x"):
-        data = "0x" + data
-
-    # Remove 0x prefix for processing
-    hex_data = data[2:] if data.startswith("0x") else data
+    # "|" is not hex, so no match can span two blobs; the "x" of each "0x"
+    # prefix likewise keeps it out of any match.
+    hex_data = "|".join(blobs).lower()
 
     # Look for 32-byte padded addresses (24 zeros + 40 char address)
-    padded_pattern = re.compile(r"0{24}([a-fA-F0-9]{40})")
-    for match in padded_pattern.finditer(hex_data):
-        addr = "0x" + match.group(1).lower()
-        addresses.add(addr)
-
-    return addresses
+    return {"0x" + match.group(1) for match in _PADDED_ADDR_RE.finditer(hex_data)}
 
 
 def _filter_addresses(addresses: Set[str]) -> Set[str]:
-    """Filter out known non-token addresses and invalid patterns."""
-    # Common addresses to exclude (routers, WETH, null address)
-    exclude = {
-        "0x0000000000000000000000000000000000000000",  # Null
-        "0x4200000000000000000000000000000000000006",  # Base WETH
-        "0x4752ba5dbc23f44d87826276bf6fd6b1c372ad24",  # Uniswap V2 Router
-        "0x2626664c2603336e57b271c5c0b26f421741e481",  # Uniswap V3 Router
-        "0xcf77a3ba9a5ca399b7c97c74d54e5b1beb874e43",  # Aerodrome Router
-    }
+    """Filter out known non-token addresses and invalid patterns.
 
-    filtered = set()
-    for addr in addresses:
-        addr_lower = addr.lower()
+    Addresses must already be lowercase, as every extraction path produces.
+    """
+    return set(_token_addresses(addresses))
 
+
+def _token_addresses(addresses: Iterable[str]) -> List[str]:
+    """Return the lowercase ``addresses`` that look like token contracts."""
+    filtered = []
+    for addr in addresses:
         # Skip excluded addresses
-        if addr_lower in exclude:
+        if addr in _EXCLUDED_ADDRESSES:
             continue
 
-        # Count leading zeros after 0x prefix
-        hex_part = addr_lower[2:]  # Remove 0x
-        leading_zeros = len(hex_part) - len(hex_part.lstrip("0"))
+        hex_part = addr[2:]  # Remove 0x
 
         # Real token addresses typically don't have more than 16 leading zeros
         # Addresses with many leading zeros are usually small numbers (parameters)
-        if leading_zeros > 16:
+        if hex_part.startswith(_TOO_MANY_LEADING_ZEROS):
             continue
 
         # Skip addresses that are mostly zeros (low entropy)
-        non_zero_chars = hex_part.replace("0", "")
-        if len(non_zero_chars) < 8:
+        if len(hex_part) - hex_part.count("0") < 8:
             continue
 
-        filtered.add(addr_lower)
+        filtered.append(addr)
 
     return filtered
 
@@ -3,6 +3,8 @@
 import pytest
 from unittest.mock import MagicMock, AsyncMock
 
+import google.generativeai as genai
+
 from app.agentic_planner import (
     AgenticPlanner,
     AgenticContext,
@@ -17,73 +19,106 @@ from app.tool_converter import (
     parse_function_call_name,
 )
 
+_POOLS_20 = tuple({"id": i} for i in range(20))
+_RANGE_20 = tuple(range(20))
+_LOWER_PROMPT = AGENTIC_SYSTEM_PROMPT.lower()
 
-class TestToolConverter:
-    """Tests for MCP to Gemini tool conversion."""
 
-    def test_mcp_type_to_gemini_type_string(self) -> None:
-        """Test string type conversion."""
-        import google.generativeai as genai
+def _fc(name, args=None):
+    """Create a mock Gemini function call."""
+    fc = MagicMock()
+    fc.name = name
+    fc.args = args or {}
+    return fc
 
-        result = mcp_type_to_gemini_type("string")
-        assert result == genai.protos.Type.STRING
 
-    def test_mcp_type_to_gemini_type_integer(self) -> None:
-        """Test integer type conversion."""
-        import google.generativeai as genai
+@pytest.fixture
+def mock_mcp():
+    """Create a mocked MCP manager."""
+    return MagicMock()
 
-        result = mcp_type_to_gemini_type("integer")
-        assert result == genai.protos.Type.INTEGER
 
-    def test_mcp_type_to_gemini_type_boolean(self) -> None:
-        """Test boolean type conversion."""
-        import google.generativeai as genai
+@pytest.fixture
+def planner(mock_mcp):
+    """Create a planner backed by the mocked MCP manager."""
+    return AgenticPlanner(api_key="test", mcp_manager=mock_mcp)
 
-        result = mcp_type_to_gemini_type("boolean")
-        assert result == genai.protos.Type.BOOLEAN
 
-    def test_mcp_type_to_gemini_type_unknown(self) -> None:
-        """Test unknown type defaults to string."""
-        import google.generativeai as genai
+@pytest.fixture
+def success_client():
+    """Create an MCP client whose tool calls all succeed."""
+    client = MagicMock()
+    client.call_tool = AsyncMock(return_value={"success": True})
+    return client
 
-        result = mcp_type_to_gemini_type("unknown_type")
-        assert result == genai.protos.Type.STRING
 
-    def test_convert_simple_schema(self) -> None:
-        """Test converting a simple string schema."""
-        import google.generativeai as genai
+@pytest.fixture(scope="session")
+def pools_result():
+    """Pool search result with two tokens; extraction only reads it."""
+    return {
+        "pools": [
+            {
+                "chain": "base",
+                "tokens": [
+                    {"id": "0x123", "symbol": "TEST", "name": "Test Token"},
+                    {"id": "0x456", "symbol": "WETH", "name": "Wrapped Ether"},
+                ],
+            }
+        ]
+    }
 
-        schema = {"type": "string", "description": "A test string"}
-        result = convert_json_schema_to_gemini_schema(schema)
-        assert result.type == genai.protos.Type.STRING
 
-    def test_convert_object_schema(self) -> None:
-        """Test converting an object schema with properties."""
-        import google.generativeai as genai
+@pytest.fixture
+def ctx():
+    """Create an empty agentic context."""
+    return AgenticContext()
 
-        schema = {
-            "type": "object",
-            "properties": {
-                "network": {"type": "string"},
-                "limit": {"type": "integer"},
-            },
-            "required": ["network"],
-        }
-        result = convert_json_schema_to_gemini_schema(schema)
-        assert result.type == genai.protos.Type.OBJECT
-        assert "network" in result.properties
-        assert "limit" in result.properties
 
-    def test_convert_array_schema(self) -> None:
-        """Test converting an array schema."""
-        import google.generativeai as genai
+class TestToolConverter:
+    """Tests for MCP to Gemini tool conversion."""
 
-        schema = {
-            "type": "array",
-            "items": {"type": "string"},
-        }
+    @pytest.mark.parametrize(
+        "mcp,expected",
+        [
+            ("string", "STRING"),
+            ("integer", "INTEGER"),
+            ("boolean", "BOOLEAN"),
+            ("unknown_type", "STRING"),
+        ],
+    )
+    def test_mcp_type_to_gemini_type(self, mcp: str, expected: str) -> None:
+        """Test type conversion, with unknown types defaulting to string."""
+        result = mcp_type_to_gemini_type(mcp)
+        assert result == getattr(genai.protos.Type, expected)
+
+    @pytest.mark.parametrize(
+        "schema,expected,properties",
+        [
+            ({"type": "string", "description": "A test string"}, "STRING", ()),
+            (
+                {
+                    "type": "object",
+                    "properties": {
+                        "network": {"type": "string"},
+                        "limit": {"type": "integer"},
+                    },
+                    "required": ["network"],
+                },
+                "OBJECT",
+                ("network", "limit"),
+            ),
+            ({"type": "array", "items": {"type": "string"}}, "ARRAY", ()),
+        ],
+        ids=["simple", "object", "array"],
+    )
+    def test_convert_schema(
+        self, schema: dict, expected: str, properties: tuple
+    ) -> None:
+        """Test converting JSON schemas to Gemini schemas."""
         result = convert_json_schema_to_gemini_schema(schema)
-        assert result.type == genai.protos.Type.ARRAY
+        assert result.type == getattr(genai.protos.Type, expected)
+        for name in properties:
+            assert name in result.properties
 
     def test_mcp_tool_to_gemini_function(self) -> None:
         """Test converting an MCP tool to Gemini function."""
@@ -130,17 +165,16 @@ class TestToolConverter:
         assert result[0].name == "client_tool1"
         assert result[1].name == "client_tool2"
 
-    def test_parse_function_call_name(self) -> None:
-        """Test parsing namespaced function names."""
-        client, method = parse_function_call_name("dexpaprika_getNetworkPools")
-        assert client == "dexpaprika"
-        assert method == "getNetworkPools"
-
-    def test_parse_function_call_name_no_underscore(self) -> None:
-        """Test parsing function name without underscore."""
-        client, method = parse_function_call_name("someMethod")
-        assert client == ""
-        assert method == "someMethod"
+    @pytest.mark.parametrize(
+        "name,expected",
+        [
+            ("dexpaprika_getNetworkPools", ("dexpaprika", "getNetworkPools")),
+            ("someMethod", ("", "someMethod")),
+        ],
+    )
+    def test_parse_function_call_name(self, name: str, expected: tuple) -> None:
+        """Test parsing namespaced and bare function names."""
+        assert parse_function_call_name(name) == expected
 
 
 class TestAgenticContext:
@@ -193,88 +227,51 @@ class TestToolCall:
 class TestAgenticPlanner:
     """Tests for AgenticPlanner."""
 
-    def test_planner_initialization(self) -> None:
-        """Test planner initialization."""
-        mock_mcp = MagicMock()
-        mock_mcp.get_gemini_functions = MagicMock(return_value=[])
-
-        planner = AgenticPlanner(
-            api_key="test-key",
-            mcp_manager=mock_mcp,
-            model_name="gemini-1.5-flash",
-        )
-
-        assert planner.max_iterations == 8
-        assert planner.max_tool_calls == 30
-        assert planner.timeout_seconds == 90
-
-    def test_planner_custom_settings(self) -> None:
-        """Test planner with custom settings."""
-        mock_mcp = MagicMock()
-
-        planner = AgenticPlanner(
-            api_key="test-key",
-            mcp_manager=mock_mcp,
-            max_iterations=3,
-            max_tool_calls=10,
-            timeout_seconds=30,
-        )
-
-        assert planner.max_iterations == 3
-        assert planner.max_tool_calls == 10
-        assert planner.timeout_seconds == 30
-
-    def test_truncate_result_dict_with_pools(self) -> None:
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [
+            ({}, (8, 30, 90)),
+            (
+                {"max_iterations": 3, "max_tool_calls": 10, "timeout_seconds": 30},
+                (3, 10, 30),
+            ),
+        ],
+        ids=["defaults", "custom"],
+    )
+    def test_planner_settings(self, mock_mcp, kwargs, expected) -> None:
+        """Test planner limits with default and custom settings."""
+        planner = AgenticPlanner(api_key="test-key", mcp_manager=mock_mcp, **kwargs)
+
+        assert (
+            planner.max_iterations,
+            planner.max_tool_calls,
+            planner.timeout_seconds,
+        ) == expected
+
+    def test_truncate_result_dict_with_pools(self, planner) -> None:
         """Test truncating dict with pools list."""
-        mock_mcp = MagicMock()
-        planner = AgenticPlanner(api_key="test", mcp_manager=mock_mcp)
-
-        result = {
-            "pools": [{"id": i} for i in range(20)],
-        }
+        result = {"pools": list(_POOLS_20)}
 
         truncated = planner._truncate_result(result, max_items=5)
         assert len(truncated["pools"]) == 5
         assert truncated.get("_pools_truncated") is True
 
-    def test_truncate_result_list(self) -> None:
+    def test_truncate_result_list(self, planner) -> None:
         """Test truncating a plain list."""
-        mock_mcp = MagicMock()
-        planner = AgenticPlanner(api_key="test", mcp_manager=mock_mcp)
-
-        result = list(range(20))
+        result = list(_RANGE_20)
         truncated = planner._truncate_result(result, max_items=5)
         assert len(truncated) == 5
 
-    def test_extract_tokens_from_pools(self) -> None:
+    def test_extract_tokens_from_pools(self, planner, ctx, pools_result) -> None:
         """Test extracting tokens from pool results."""
-        mock_mcp = MagicMock()
-        planner = AgenticPlanner(api_key="test", mcp_manager=mock_mcp)
-        ctx = AgenticContext()
-
-        result = {
-            "pools": [
-                {
-                    "chain": "base",
-                    "tokens": [
-                        {"id": "0x123", "symbol": "TEST", "name": "Test Token"},
-                        {"id": "0x456", "symbol": "WETH", "name": "Wrapped Ether"},
-                    ],
-                }
-            ]
-        }
-
-        planner._extract_tokens_from_result(result, ctx)
+        planner._extract_tokens_from_result(pools_result, ctx)
 
         assert len(ctx.tokens_found) == 2
         assert ctx.tokens_found[0]["symbol"] == "TEST"
         assert ctx.tokens_found[1]["symbol"] == "WETH"
 
-    def test_build_initial_messages(self) -> None:
+    def test_build_initial_messages(self, planner) -> None:
         """Test building initial message list."""
-        mock_mcp = MagicMock()
-        planner = AgenticPlanner(api_key="test", mcp_manager=mock_mcp)
-
         context = {
             "recent_tokens": [
                 {"symbol": "PEPE", "address": "0x1234567890abcdef"},
@@ -289,21 +286,14 @@ class TestAgenticPlanner:
         user_text = messages[-1]["parts"][0]["text"]
         assert "Check PEPE" in user_text
 
-    def test_synthesize_partial_response_no_calls(self) -> None:
+    def test_synthesize_partial_response_no_calls(self, planner, ctx) -> None:
         """Test synthesizing response with no tool calls."""
-        mock_mcp = MagicMock()
-        planner = AgenticPlanner(api_key="test", mcp_manager=mock_mcp)
-        ctx = AgenticContext()
-
         result = planner._synthesize_partial_response("test query", ctx)
 
         assert "couldn't complete" in result.message.lower()
 
-    def test_synthesize_partial_response_with_calls(self) -> None:
+    def test_synthesize_partial_response_with_calls(self, planner, ctx) -> None:
         """Test synthesizing response with tool calls."""
-        mock_mcp = MagicMock()
-        planner = AgenticPlanner(api_key="test", mcp_manager=mock_mcp)
-        ctx = AgenticContext()
         ctx.tool_calls.append(
             ToolCall(
                 client="dexpaprika",
@@ -323,84 +313,49 @@ class TestAgenticPlannerAsync:
     """Async tests for AgenticPlanner."""
 
     @pytest.mark.asyncio
-    async def test_execute_single_tool_unknown_client(self) -> None:
-        """Test executing tool with unknown client."""
-        mock_mcp = MagicMock()
-        mock_mcp.get_client = MagicMock(return_value=None)
-
-        planner = AgenticPlanner(api_key="test", mcp_manager=mock_mcp)
-        ctx = AgenticContext()
-
-        # Create mock function call
-        mock_fc = MagicMock()
-        mock_fc.name = "unknown_someMethod"
-        mock_fc.args = {}
-
-        result = await planner._execute_single_tool(mock_fc, ctx)
-
-        assert "error" in result
-        assert "unknown" in result["error"].lower()
-
-    @pytest.mark.asyncio
-    async def test_execute_single_tool_success(self) -> None:
+    async def test_execute_single_tool_success(self, planner, mock_mcp, ctx) -> None:
         """Test executing tool successfully."""
         mock_client = MagicMock()
         mock_client.call_tool = AsyncMock(return_value={"data": "test"})
-
-        mock_mcp = MagicMock()
         mock_mcp.get_client = MagicMock(return_value=mock_client)
 
-        planner = AgenticPlanner(api_key="test", mcp_manager=mock_mcp)
-        ctx = AgenticContext()
-
-        mock_fc = MagicMock()
-        mock_fc.name = "test_someMethod"
-        mock_fc.args = {"param": "value"}
-
-        result = await planner._execute_single_tool(mock_fc, ctx)
+        result = await planner._execute_single_tool(
+            _fc("test_someMethod", {"param": "value"}), ctx
+        )
 
         assert result == {"data": "test"}
         mock_client.call_tool.assert_awaited_once_with("someMethod", {"param": "value"})
 
     @pytest.mark.asyncio
-    async def test_execute_single_tool_error(self) -> None:
-        """Test executing tool that raises an error."""
-        mock_client = MagicMock()
-        mock_client.call_tool = AsyncMock(side_effect=RuntimeError("API error"))
-
-        mock_mcp = MagicMock()
+    @pytest.mark.parametrize(
+        "name,side_effect,expected",
+        [
+            ("unknown_someMethod", None, "Unknown client: unknown"),
+            ("test_failingMethod", RuntimeError("API error"), "API error"),
+        ],
+        ids=["unknown_client", "call_raises"],
+    )
+    async def test_execute_single_tool_error(
+        self, planner, mock_mcp, ctx, name, side_effect, expected
+    ) -> None:
+        """Test unknown clients and failing calls come back as error dicts."""
+        mock_client = None
+        if side_effect is not None:
+            mock_client = MagicMock()
+            mock_client.call_tool = AsyncMock(side_effect=side_effect)
         mock_mcp.get_client = MagicMock(return_value=mock_client)
 
-        planner = AgenticPlanner(api_key="test", mcp_manager=mock_mcp)
-        ctx = AgenticContext()
-
-        mock_fc = MagicMock()
-        mock_fc.name = "test_failingMethod"
-        mock_fc.args = {}
+        result = await planner._execute_single_tool(_fc(name), ctx)
 
-        result = await planner._execute_single_tool(mock_fc, ctx)
-
-        assert "error" in result
-        assert "API error" in result["error"]
+        assert expected in result["error"]
 
     @pytest.mark.asyncio
-    async def test_execute_tools_parallel(self) -> None:
+    async def test_execute_tools_parallel(
+        self, planner, mock_mcp, ctx, success_client
+    ) -> None:
         """Test parallel execution of multiple tools."""
-        mock_client = MagicMock()
-        mock_client.call_tool = AsyncMock(return_value={"success": True})
-
-        mock_mcp = MagicMock()
-        mock_mcp.get_client = MagicMock(return_value=mock_client)
-
-        planner = AgenticPlanner(api_key="test", mcp_manager=mock_mcp)
-        ctx = AgenticContext()
-
-        mock_fcs = []
-        for i in range(3):
-            fc = MagicMock()
-            fc.name = f"test_method{i}"
-            fc.args = {}
-            mock_fcs.append(fc)
+        mock_mcp.get_client = MagicMock(return_value=success_client)
+        mock_fcs = [_fc(f"test_method{i}") for i in range(3)]
 
         results = await planner._execute_tools_parallel(mock_fcs, ctx)
 
@@ -413,12 +368,12 @@ class TestAgenticPlannerAsync:
 class TestSystemPrompt:
     """Tests for system prompt."""
 
-    def test_system_prompt_contains_guidelines(self) -> None:
+    @pytest.mark.parametrize(
+        "needle", ["honeypot", "dexpaprika", "dexscreener", "base"]
+    )
+    def test_system_prompt_contains_guidelines(self, needle: str) -> None:
         """Test that system prompt contains key guidelines."""
-        assert "honeypot" in AGENTIC_SYSTEM_PROMPT.lower()
-        assert "dexpaprika" in AGENTIC_SYSTEM_PROMPT.lower()
-        assert "dexscreener" in AGENTIC_SYSTEM_PROMPT.lower()
-        assert "base" in AGENTIC_SYSTEM_PROMPT.lower()
+        assert needle in _LOWER_PROMPT
 
     def test_system_prompt_has_workflow(self) -> None:
         """Test that system prompt has workflow section."""
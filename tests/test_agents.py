@@ -1,5 +1,8 @@
 """Tests for the hierarchical agent system."""
 
+import asyncio
+import json
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
@@ -8,9 +11,26 @@ import google.generativeai as genai
 from app.agents.context import AgentContext
 from app.agents.base import BaseAgent
 from app.agents.coordinator import CoordinatorAgent
+from app.agents.discovery import DiscoveryAgent
+from app.agents.market import MarketAgent
+from app.agents.safety import SafetyAgent
+from app.utils.json_utils import parse_llm_json
+
+
+class ConcreteAgent(BaseAgent):
+    """Minimal agent for exercising BaseAgent helpers."""
+
+    async def run(self, context):
+        return {}
+
+
+@pytest.fixture(autouse=True)
+def _patch_genai_configure(monkeypatch):
+    """Keep tests from configuring the real Gemini client."""
+    monkeypatch.setattr(genai, "configure", MagicMock())
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_mcp():
     """Create a mocked MCP manager."""
     mcp = MagicMock()
@@ -20,54 +40,65 @@ def mock_mcp():
     return mcp
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def base_agent():
+    """Create a concrete agent for testing."""
+    return ConcreteAgent("test", MagicMock(), MagicMock())
+
+
+@pytest.fixture(scope="module")
 def mock_coordinator(mock_mcp):
-    """Create a coordinator with mocked dependencies."""
-    genai.configure = MagicMock()
-    return CoordinatorAgent(
-        api_key="fake-key",
-        mcp_manager=mock_mcp,
-        model_name="gemini-1.5-flash",
-        router_map={"uniswap_v2": {"base-mainnet": "0x1234"}},
-    )
+    """Create a coordinator with mocked dependencies, shared by the module.
+
+    Tests that swap out coordinator methods must do so via ``monkeypatch``.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(genai, "configure", MagicMock())
+        return CoordinatorAgent(
+            api_key="fake-key",
+            mcp_manager=mock_mcp,
+            model_name="gemini-1.5-flash",
+            router_map={"uniswap_v2": {"base-mainnet": "0x1234"}},
+        )
 
 
 class TestAgentContext:
     """Tests for AgentContext."""
 
-    def test_add_tokens_deduplication(self) -> None:
-        """Test that add_tokens deduplicates by address."""
-        ctx = AgentContext(message="test")
-
-        tokens1 = [
-            {"address": "0xAAA", "symbol": "TOKEN1"},
-            {"address": "0xBBB", "symbol": "TOKEN2"},
-        ]
-        tokens2 = [
-            {
-                "address": "0xaaa",
-                "symbol": "TOKEN1_DUP",
-            },  # Same address, different case
-            {"address": "0xCCC", "symbol": "TOKEN3"},
-        ]
-
-        ctx.add_tokens(tokens1)
-        ctx.add_tokens(tokens2)
-
-        assert len(ctx.found_tokens) == 3
-        addresses = [t["address"] for t in ctx.found_tokens]
-        assert "0xAAA" in addresses
-        assert "0xBBB" in addresses
-        assert "0xCCC" in addresses
-
-    def test_add_tokens_handles_tokenAddress_field(self) -> None:
-        """Test deduplication works with tokenAddress field."""
+    @pytest.mark.parametrize(
+        "batches,expected_symbols",
+        [
+            (
+                [
+                    [
+                        {"address": "0xAAA", "symbol": "TOKEN1"},
+                        {"address": "0xBBB", "symbol": "TOKEN2"},
+                    ],
+                    [
+                        # Same address, different case
+                        {"address": "0xaaa", "symbol": "TOKEN1_DUP"},
+                        {"address": "0xCCC", "symbol": "TOKEN3"},
+                    ],
+                ],
+                ["TOKEN1", "TOKEN2", "TOKEN3"],
+            ),
+            (
+                [
+                    [{"tokenAddress": "0xAAA", "symbol": "T1"}],
+                    [{"address": "0xaaa", "symbol": "T1_DUP"}],
+                ],
+                ["T1"],
+            ),
+        ],
+        ids=["address", "tokenAddress"],
+    )
+    def test_add_tokens_deduplication(self, batches, expected_symbols) -> None:
+        """Test that add_tokens deduplicates by address across both fields."""
         ctx = AgentContext(message="test")
+        for batch in batches:
+            ctx.add_tokens(batch)
 
-        ctx.add_tokens([{"tokenAddress": "0xAAA", "symbol": "T1"}])
-        ctx.add_tokens([{"address": "0xaaa", "symbol": "T1_DUP"}])
-
-        assert len(ctx.found_tokens) == 1
+        assert [t["symbol"] for t in ctx.found_tokens] == expected_symbols
 
     def test_get_recent_token_addresses(self) -> None:
         """Test extracting addresses from tokens."""
@@ -88,106 +119,82 @@ class TestAgentContext:
 class TestBaseAgentParseJson:
     """Tests for BaseAgent._parse_json."""
 
-    def _make_agent(self) -> BaseAgent:
-        """Create a concrete agent for testing."""
-
-        class ConcreteAgent(BaseAgent):
-            async def run(self, context):
-                return {}
-
-        model = MagicMock()
-        mcp = MagicMock()
-        return ConcreteAgent("test", model, mcp)
-
-    def test_parse_json_plain(self) -> None:
-        """Test parsing plain JSON."""
-        agent = self._make_agent()
-        result = agent._parse_json('{"key": "value"}')
-        assert result == {"key": "value"}
-
-    def test_parse_json_with_markdown_code_block(self) -> None:
-        """Test parsing JSON wrapped in markdown code block."""
-        agent = self._make_agent()
-        result = agent._parse_json('```json\n{"key": "value"}\n```')
-        assert result == {"key": "value"}
-
-    def test_parse_json_with_trailing_whitespace(self) -> None:
-        """Test parsing JSON with trailing whitespace after code block."""
-        agent = self._make_agent()
-        result = agent._parse_json('```json\n{"key": "value"}\n```\n\n')
-        assert result == {"key": "value"}
-
-    def test_parse_json_with_leading_whitespace(self) -> None:
-        """Test parsing JSON with leading whitespace."""
-        agent = self._make_agent()
-        result = agent._parse_json('  \n```json\n{"key": "value"}\n```')
-        assert result == {"key": "value"}
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            '{"key": "value"}',
+            '```json\n{"key": "value"}\n```',
+            '```json\n{"key": "value"}\n```\n\n',
+            '  \n```json\n{"key": "value"}\n```',
+        ],
+        ids=["plain", "code_block", "trailing_whitespace", "leading_whitespace"],
+    )
+    def test_parse_json(self, base_agent, raw) -> None:
+        """Test parsing JSON with and without markdown code blocks."""
+        assert base_agent._parse_json(raw) == {"key": "value"}
 
 
 class TestCoordinatorSummarizeResults:
     """Tests for CoordinatorAgent._summarize_results."""
 
-    def test_summarize_router_activity(self, mock_coordinator) -> None:
-        """Test summarizing router activity results."""
-        results = [
-            {
-                "call": {"client": "base", "method": "getDexRouterActivity"},
-                "result": {
-                    "items": [
-                        {"method": "swap"},
-                        {"method": "addLiquidity"},
-                        {"function": "removeLiquidity"},
-                    ]
-                },
-            }
-        ]
-
-        summary = mock_coordinator._summarize_results(results)
-        assert "3 transactions found" in summary
-        assert "swap" in summary
-
-    def test_summarize_dexscreener_pairs(self, mock_coordinator) -> None:
-        """Test summarizing Dexscreener pair results."""
-        results = [
-            {
-                "call": {"client": "dexscreener", "method": "searchPairs"},
-                "result": {
-                    "pairs": [
-                        {"baseToken": {"symbol": "PEPE"}},
-                        {"baseToken": {"symbol": "DOGE"}},
-                    ]
-                },
-            }
-        ]
-
-        summary = mock_coordinator._summarize_results(results)
-        assert "2 pairs found" in summary
-        assert "PEPE" in summary
-
-    def test_summarize_honeypot_check(self, mock_coordinator) -> None:
-        """Test summarizing honeypot check results."""
-        results = [
-            {
-                "call": {"client": "honeypot", "method": "check_token"},
-                "result": {"summary": {"verdict": "SAFE_TO_TRADE"}},
-            }
-        ]
-
-        summary = mock_coordinator._summarize_results(results)
-        assert "Verdict: SAFE_TO_TRADE" in summary
-
-    def test_summarize_error_result(self, mock_coordinator) -> None:
-        """Test summarizing error results."""
-        results = [
-            {
-                "call": {"client": "base", "method": "getDexRouterActivity"},
-                "error": "Connection timeout",
-            }
-        ]
-
+    @pytest.mark.parametrize(
+        "results,expected",
+        [
+            (
+                [
+                    {
+                        "call": {"client": "base", "method": "getDexRouterActivity"},
+                        "result": {
+                            "items": [
+                                {"method": "swap"},
+                                {"method": "addLiquidity"},
+                                {"function": "removeLiquidity"},
+                            ]
+                        },
+                    }
+                ],
+                ["3 transactions found", "swap"],
+            ),
+            (
+                [
+                    {
+                        "call": {"client": "dexscreener", "method": "searchPairs"},
+                        "result": {
+                            "pairs": [
+                                {"baseToken": {"symbol": "PEPE"}},
+                                {"baseToken": {"symbol": "DOGE"}},
+                            ]
+                        },
+                    }
+                ],
+                ["2 pairs found", "PEPE"],
+            ),
+            (
+                [
+                    {
+                        "call": {"client": "honeypot", "method": "check_token"},
+                        "result": {"summary": {"verdict": "SAFE_TO_TRADE"}},
+                    }
+                ],
+                ["Verdict: SAFE_TO_TRADE"],
+            ),
+            (
+                [
+                    {
+                        "call": {"client": "base", "method": "getDexRouterActivity"},
+                        "error": "Connection timeout",
+                    }
+                ],
+                ["Error", "Connection timeout"],
+            ),
+        ],
+        ids=["router_activity", "dexscreener_pairs", "honeypot_check", "error"],
+    )
+    def test_summarize(self, mock_coordinator, results, expected) -> None:
+        """Test summarizing router, Dexscreener, honeypot and error results."""
         summary = mock_coordinator._summarize_results(results)
-        assert "Error" in summary
-        assert "Connection timeout" in summary
+        for text in expected:
+            assert text in summary
 
     def test_summarize_empty_results(self, mock_coordinator) -> None:
         """Test summarizing empty results."""
@@ -198,36 +205,42 @@ class TestCoordinatorSummarizeResults:
 class TestParseJsonUtility:
     """Tests for the shared parse_llm_json utility."""
 
-    def test_parse_plain_json(self) -> None:
-        """Test parsing plain JSON."""
-        from app.utils.json_utils import parse_llm_json
-
-        result = parse_llm_json('{"key": "value"}')
-        assert result == {"key": "value"}
-
-    def test_parse_json_with_code_block(self) -> None:
-        """Test parsing JSON with markdown code block."""
-        from app.utils.json_utils import parse_llm_json
-
-        result = parse_llm_json('```json\n{"key": "value"}\n```')
-        assert result == {"key": "value"}
-
-    def test_parse_json_with_extra_whitespace(self) -> None:
-        """Test parsing JSON with extra whitespace."""
-        from app.utils.json_utils import parse_llm_json
-
-        result = parse_llm_json('  \n```json\n{"key": "value"}\n```\n\n  ')
-        assert result == {"key": "value"}
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            '{"key": "value"}',
+            '```json\n{"key": "value"}\n```',
+            '  \n```json\n{"key": "value"}\n```\n\n  ',
+            '```\n{"key": "value"}\n```',
+            '```json{"key": "value"}```',
+        ],
+        ids=[
+            "plain",
+            "code_block",
+            "extra_whitespace",
+            "bare_code_block",
+            "single_line_code_block",
+        ],
+    )
+    def test_parse_json(self, raw) -> None:
+        """Test parsing JSON with and without markdown code blocks."""
+        assert parse_llm_json(raw) == {"key": "value"}
 
 
 class TestCoordinatorIntegration:
     """Integration tests for CoordinatorAgent.run()."""
 
     @pytest.mark.asyncio
-    async def test_run_finishes_with_response(self, mock_coordinator) -> None:
+    async def test_run_finishes_with_response(
+        self, mock_coordinator, monkeypatch
+    ) -> None:
         """Test that run() returns a PlannerResult when LLM says FINISH."""
-        mock_coordinator._generate_content = AsyncMock(
-            return_value='{"reasoning": "Done", "next_agent": "FINISH", "final_response": "Here is your answer."}'
+        monkeypatch.setattr(
+            mock_coordinator,
+            "_generate_content",
+            AsyncMock(
+                return_value='{"reasoning": "Done", "next_agent": "FINISH", "final_response": "Here is your answer."}'
+            ),
         )
 
         result = await mock_coordinator.run("test message", {})
@@ -236,20 +249,22 @@ class TestCoordinatorIntegration:
         assert "Here is your answer" in result.message
 
     @pytest.mark.asyncio
-    async def test_run_delegates_to_agent(self, mock_coordinator) -> None:
+    async def test_run_delegates_to_agent(self, mock_coordinator, monkeypatch) -> None:
         """Test that run() delegates to the correct sub-agent."""
-        call_count = 0
-
-        async def mock_generate(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                return '{"reasoning": "Need discovery", "next_agent": "discovery"}'
-            return '{"reasoning": "Done", "next_agent": "FINISH", "final_response": "Found tokens."}'
-
-        mock_coordinator._generate_content = mock_generate
-        mock_coordinator.agents["discovery"].run = AsyncMock(
-            return_value={"output": "Found 2 tokens", "data": []}
+        monkeypatch.setattr(
+            mock_coordinator,
+            "_generate_content",
+            AsyncMock(
+                side_effect=[
+                    '{"reasoning": "Need discovery", "next_agent": "discovery"}',
+                    '{"reasoning": "Done", "next_agent": "FINISH", "final_response": "Found tokens."}',
+                ]
+            ),
+        )
+        monkeypatch.setattr(
+            mock_coordinator.agents["discovery"],
+            "run",
+            AsyncMock(return_value={"output": "Found 2 tokens", "data": []}),
         )
 
         result = await mock_coordinator.run("find PEPE", {})
@@ -263,8 +278,6 @@ class TestDiscoveryAgent:
 
     def test_chain_id_passed_to_prompt(self, mock_mcp) -> None:
         """Test that chain_id is passed correctly to the prompt."""
-        from app.agents.discovery import DiscoveryAgent
-
         model = MagicMock()
         agent = DiscoveryAgent(model, mock_mcp)
 
@@ -276,8 +289,6 @@ class TestDiscoveryAgent:
 
         ctx = AgentContext(message="find 0x1234", network="base")
 
-        import asyncio
-
         asyncio.get_event_loop().run_until_complete(agent.run(ctx))
 
         # Verify chain_id was passed
@@ -288,8 +299,6 @@ class TestDiscoveryAgent:
 
     def test_chain_id_normalizes_base_mainnet(self, mock_mcp) -> None:
         """Test that base-mainnet normalizes to base."""
-        from app.agents.discovery import DiscoveryAgent
-
         model = MagicMock()
         agent = DiscoveryAgent(model, mock_mcp)
 
@@ -300,8 +309,6 @@ class TestDiscoveryAgent:
 
         ctx = AgentContext(message="find token", network="base-mainnet")
 
-        import asyncio
-
         asyncio.get_event_loop().run_until_complete(agent.run(ctx))
 
         call_kwargs = agent._load_prompt.call_args[1]
@@ -313,8 +320,6 @@ class TestMarketAgent:
 
     def test_router_addresses_formatted(self, mock_mcp) -> None:
         """Test that router addresses are formatted correctly in prompt."""
-        from app.agents.market import MarketAgent
-
         model = MagicMock()
         agent = MarketAgent(model, mock_mcp)
 
@@ -332,8 +337,6 @@ class TestMarketAgent:
             },
         )
 
-        import asyncio
-
         asyncio.get_event_loop().run_until_complete(agent.run(ctx))
 
         call_kwargs = agent._load_prompt.call_args[1]
@@ -347,8 +350,6 @@ class TestSafetyAgent:
 
     def test_found_tokens_formatted(self, mock_mcp) -> None:
         """Test that found tokens are formatted correctly in prompt."""
-        from app.agents.safety import SafetyAgent
-
         model = MagicMock()
         agent = SafetyAgent(model, mock_mcp)
 
@@ -365,15 +366,11 @@ class TestSafetyAgent:
             ]
         )
 
-        import asyncio
-
         asyncio.get_event_loop().run_until_complete(agent.run(ctx))
 
         call_kwargs = agent._load_prompt.call_args[1]
         tokens_str = call_kwargs["found_tokens"]
 
-        import json
-
         tokens = json.loads(tokens_str)
         assert len(tokens) == 2
         assert tokens[0]["symbol"] == "PEPE"
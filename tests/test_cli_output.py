@@ -3,6 +3,8 @@
 import io
 import json
 
+import pytest
+
 from app.cli_output import (
     CLIOutput,
     OutputFormat,
@@ -13,23 +15,37 @@ from app.cli_output import (
 from app.planner_types import PlannerResult
 
 
+@pytest.fixture
+def stream():
+    """In-memory stream that captures CLI output."""
+    return io.StringIO()
+
+
+@pytest.fixture
+def make_output(stream):
+    """Build CLIOutput instances that write to the shared stream."""
+
+    def _make(fmt=OutputFormat.TEXT, verbose=False):
+        return CLIOutput(format=fmt, verbose=verbose, stream=stream)
+
+    return _make
+
+
 class TestCLIOutput:
     """Tests for CLIOutput class."""
 
-    def test_text_output_basic(self):
+    def test_text_output_basic(self, make_output, stream):
         """Test basic text output."""
-        stream = io.StringIO()
-        output = CLIOutput(format=OutputFormat.TEXT, stream=stream)
+        output = make_output(OutputFormat.TEXT)
         result = PlannerResult(message="Hello world", tokens=[])
 
         output.result(result)
 
         assert "Hello world" in stream.getvalue()
 
-    def test_text_output_strips_markdown(self):
+    def test_text_output_strips_markdown(self, make_output, stream):
         """Test that markdown escapes are stripped."""
-        stream = io.StringIO()
-        output = CLIOutput(format=OutputFormat.TEXT, stream=stream)
+        output = make_output(OutputFormat.TEXT)
         # Use raw string - this is how Telegram markdown actually looks
         result = PlannerResult(message=r"Price: \$100\.00", tokens=[])
 
@@ -37,10 +53,9 @@ class TestCLIOutput:
 
         assert "Price: $100.00" in stream.getvalue()
 
-    def test_text_output_verbose_shows_tokens(self):
+    def test_text_output_verbose_shows_tokens(self, make_output, stream):
         """Test verbose mode shows token context."""
-        stream = io.StringIO()
-        output = CLIOutput(format=OutputFormat.TEXT, verbose=True, stream=stream)
+        output = make_output(OutputFormat.TEXT, verbose=True)
         result = PlannerResult(
             message="Found tokens",
             tokens=[{"symbol": "PEPE", "address": "0x123"}],
@@ -52,10 +67,9 @@ class TestCLIOutput:
         assert "Token Context" in content
         assert "PEPE" in content
 
-    def test_json_output_format(self):
+    def test_json_output_format(self, make_output, stream):
         """Test JSON output format."""
-        stream = io.StringIO()
-        output = CLIOutput(format=OutputFormat.JSON, stream=stream)
+        output = make_output(OutputFormat.JSON)
         result = PlannerResult(
             message="Test message",
             tokens=[{"symbol": "TEST", "address": "0xabc"}],
@@ -68,10 +82,9 @@ class TestCLIOutput:
         assert len(data["tokens"]) == 1
         assert data["tokens"][0]["symbol"] == "TEST"
 
-    def test_json_output_strips_markdown(self):
+    def test_json_output_strips_markdown(self, make_output, stream):
         """Test JSON output also strips markdown."""
-        stream = io.StringIO()
-        output = CLIOutput(format=OutputFormat.JSON, stream=stream)
+        output = make_output(OutputFormat.JSON)
         result = PlannerResult(message=r"Price: \$50", tokens=[])
 
         output.result(result)
@@ -79,43 +92,39 @@ class TestCLIOutput:
         data = json.loads(stream.getvalue())
         assert data["message"] == "Price: $50"
 
-    def test_status_suppressed_in_json_mode(self):
+    def test_status_suppressed_in_json_mode(self, make_output, stream):
         """Test that status messages are suppressed in JSON mode."""
-        stream = io.StringIO()
-        output = CLIOutput(format=OutputFormat.JSON, stream=stream)
+        output = make_output(OutputFormat.JSON)
 
         output.status("Loading...")
 
         assert stream.getvalue() == ""
 
-    def test_info_suppressed_in_json_mode(self):
+    def test_info_suppressed_in_json_mode(self, make_output, stream):
         """Test that info messages are suppressed in JSON mode."""
-        stream = io.StringIO()
-        output = CLIOutput(format=OutputFormat.JSON, stream=stream)
+        output = make_output(OutputFormat.JSON)
 
         output.info("Some info")
 
         assert stream.getvalue() == ""
 
-    def test_status_shown_in_text_mode(self):
+    def test_status_shown_in_text_mode(self, make_output, stream):
         """Test status messages appear in text mode."""
-        stream = io.StringIO()
-        output = CLIOutput(format=OutputFormat.TEXT, stream=stream)
+        output = make_output(OutputFormat.TEXT)
 
         output.status("Loading...")
 
         assert "Loading" in stream.getvalue()
 
-    def test_info_shown_in_text_mode(self):
+    def test_info_shown_in_text_mode(self, make_output, stream):
         """Test info messages appear in text mode."""
-        stream = io.StringIO()
-        output = CLIOutput(format=OutputFormat.TEXT, stream=stream)
+        output = make_output(OutputFormat.TEXT)
 
         output.info("Information")
 
         assert "Information" in stream.getvalue()
 
-    def test_rich_fallback_when_not_installed(self, monkeypatch):
+    def test_rich_fallback_when_not_installed(self, make_output, monkeypatch):
         """Test fallback to text when rich is not installed."""
         # Simulate rich not being installed
         import builtins
@@ -129,23 +138,21 @@ class TestCLIOutput:
 
         monkeypatch.setattr(builtins, "__import__", mock_import)
 
-        stream = io.StringIO()
-        output = CLIOutput(format=OutputFormat.RICH, stream=stream)
+        output = make_output(OutputFormat.RICH)
 
         # Should have fallen back to TEXT
         assert output.format == OutputFormat.TEXT
 
-    def test_debug_only_in_verbose_mode(self, capsys):
+    def test_debug_only_in_verbose_mode(self, make_output, capsys):
         """Test debug messages only appear in verbose mode."""
         # Non-verbose - debug should not appear
-        stream = io.StringIO()
-        output = CLIOutput(format=OutputFormat.TEXT, verbose=False, stream=stream)
+        output = make_output(OutputFormat.TEXT, verbose=False)
         output.debug("Debug info")
         captured = capsys.readouterr()
         assert "Debug" not in captured.err
 
         # Verbose - debug should appear on stderr
-        output = CLIOutput(format=OutputFormat.TEXT, verbose=True, stream=stream)
+        output = make_output(OutputFormat.TEXT, verbose=True)
         output.debug("Debug info")
         captured = capsys.readouterr()
         assert "Debug" in captured.err
@@ -1,21 +1,29 @@
 """Test conversation memory functionality."""
 
+import json
 from datetime import datetime, timedelta
 
 import pytest
+import pytest_asyncio
+from sqlalchemy import text
 
 from app.store.db import ConversationMessage, Database
 from app.store.repository import Repository
 
 
+@pytest_asyncio.fixture
+async def db():
+    """Create a fresh in-memory database with all tables."""
+    database = Database("sqlite+aiosqlite:///:memory:")
+    database.connect()
+    await database.init_models()
+    yield database
+    await database.dispose()
+
+
 @pytest.mark.asyncio
-async def test_save_and_retrieve_conversation(tmp_path):
+async def test_save_and_retrieve_conversation(db):
     """Test saving and retrieving conversation messages."""
-    db_path = tmp_path / "conversation.db"
-    db = Database(f"sqlite+aiosqlite:///{db_path}")
-    db.connect()
-    await db.init_models()
-
     async with db.session() as session:
         repo = Repository(session)
 
@@ -45,16 +53,13 @@ async def test_save_and_retrieve_conversation(tmp_path):
         assert history[0].content == "What's PEPE doing?"
         assert history[1].role == "assistant"
         assert "PEPE" in history[1].content
+        assert json.loads(history[1].tokens_mentioned) == ["0xabc123"]
+        assert history[0].tokens_mentioned is None
 
 
 @pytest.mark.asyncio
-async def test_session_management(tmp_path):
+async def test_session_management(db):
     """Test session creation and inactivity timeout."""
-    db_path = tmp_path / "session.db"
-    db = Database(f"sqlite+aiosqlite:///{db_path}")
-    db.connect()
-    await db.init_models()
-
     async with db.session() as session:
         repo = Repository(session)
 
@@ -75,13 +80,8 @@ async def test_session_management(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_purge_old_conversations(tmp_path):
+async def test_purge_old_conversations(db):
     """Test purging old conversation messages."""
-    db_path = tmp_path / "purge.db"
-    db = Database(f"sqlite+aiosqlite:///{db_path}")
-    db.connect()
-    await db.init_models()
-
     async with db.session() as session:
         repo = Repository(session)
 
@@ -120,13 +120,28 @@ async def test_purge_old_conversations(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_conversation_history_limit(tmp_path):
-    """Test conversation history respects limit parameter."""
-    db_path = tmp_path / "limit.db"
-    db = Database(f"sqlite+aiosqlite:///{db_path}")
-    db.connect()
-    await db.init_models()
+async def test_purge_deletes_use_timestamp_indexes(db):
+    """Retention purges should search an index rather than scan the table."""
+    queries = {
+        "ix_conversationmessage_created_at": (
+            "DELETE FROM conversationmessage WHERE created_at < :cutoff"
+        ),
+        "ix_tokencontext_expires_at": (
+            "DELETE FROM tokencontext WHERE expires_at <= :cutoff"
+        ),
+    }
+    async with db.session() as session:
+        for index_name, sql in queries.items():
+            result = await session.execute(
+                text(f"EXPLAIN QUERY PLAN {sql}"), {"cutoff": datetime.utcnow()}
+            )
+            plan = " ".join(row[-1] for row in result.all())
+            assert index_name in plan
+
 
+@pytest.mark.asyncio
+async def test_conversation_history_limit(db):
+    """Test conversation history respects limit parameter."""
     async with db.session() as session:
         repo = Repository(session)
 
@@ -150,13 +165,8 @@ async def test_conversation_history_limit(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_clear_conversation_history(tmp_path) -> None:
+async def test_clear_conversation_history(db) -> None:
     """Test clearing conversation history for a user."""
-    db_path = tmp_path / "clear.db"
-    db = Database(f"sqlite+aiosqlite:///{db_path}")
-    db.connect()
-    await db.init_models()
-
     async with db.session() as session:
         repo = Repository(session)
 
@@ -186,13 +196,8 @@ async def test_clear_conversation_history(tmp_path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_clear_conversation_history_empty(tmp_path) -> None:
+async def test_clear_conversation_history_empty(db) -> None:
     """Test clearing when there's no history returns 0."""
-    db_path = tmp_path / "clear_empty.db"
-    db = Database(f"sqlite+aiosqlite:///{db_path}")
-    db.connect()
-    await db.init_models()
-
     async with db.session() as session:
         repo = Repository(session)
 
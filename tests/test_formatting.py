@@ -103,3 +103,17 @@ def test_format_token_summary_appends_transfer_details_before_link():
     assert output.index(entry["activityDetails"]) < output.index(
         "[View on Dexscreener]"
     )
+
+
+def test_escape_markdown_escapes_every_special_char():
+    special = "_*[]()~`>#+-=|{}.!\\"
+    assert escape_markdown(special) == "".join(f"\\{char}" for char in special)
+    assert escape_markdown("WETH 💰") == "WETH 💰"
+    assert escape_markdown(None) == ""
+    assert escape_markdown(1.5) == "1\\.5"
+
+
+def test_escape_markdown_cache_clear_resets_memo():
+    escape_markdown("cached.label")
+    escape_markdown.cache_clear()
+    assert escape_markdown("cached.label") == "cached\\.label"
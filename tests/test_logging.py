@@ -0,0 +1,65 @@
+"""Tests for logging configuration."""
+
+import json
+import logging
+import logging.handlers
+
+import pytest
+import structlog
+
+from app.utils import logging as logging_utils
+from app.utils.logging import configure_logging, get_logger
+
+
+@pytest.fixture
+def restore_logging():
+    """Put the root logger and structlog back after each test."""
+    root = logging.getLogger()
+    handlers = root.handlers[:]
+    level = root.level
+    yield
+    logging_utils._stop_listener()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+    structlog.reset_defaults()
+
+
+class TestConfigureLogging:
+    """Tests for configure_logging."""
+
+    def test_file_receives_json_records(self, tmp_path, restore_logging):
+        """Records logged through structlog land in the file as JSON."""
+        log_file = tmp_path / "logs" / "bot.log"
+        configure_logging(level="INFO", log_file=log_file, console=False)
+
+        logger = get_logger("test")
+        logger.info("hello", token="WETH")
+        logger.debug("filtered out")
+        logging_utils._stop_listener()
+
+        lines = log_file.read_text().splitlines()
+        assert len(lines) == 1
+        record = json.loads(lines[0])
+        assert record["event"] == "hello"
+        assert record["token"] == "WETH"
+        assert record["level"] == "info"
+
+    def test_root_logger_uses_single_queue_handler(self, tmp_path, restore_logging):
+        """Handlers run on the listener thread behind one queue handler."""
+        configure_logging(level="INFO", log_file=tmp_path / "bot.log", console=True)
+
+        handlers = logging.getLogger().handlers
+        assert len(handlers) == 1
+        assert isinstance(handlers[0], logging.handlers.QueueHandler)
+
+    def test_repeat_call_keeps_existing_handlers(self, tmp_path, restore_logging):
+        """Reconfiguring with identical settings is a no-op."""
+        log_file = tmp_path / "bot.log"
+        configure_logging(level="INFO", log_file=log_file, console=False)
+        handler = logging.getLogger().handlers[0]
+
+        configure_logging(level="info", log_file=log_file, console=False)
+        assert logging.getLogger().handlers == [handler]
+
+        configure_logging(level="DEBUG", log_file=log_file, console=False)
+        assert logging.getLogger().handlers != [handler]
@@ -0,0 +1,32 @@
+"""Tests for prompt template loading."""
+
+import os
+
+from app.utils.prompts import load_prompt_template
+
+
+class TestLoadPromptTemplate:
+    """Tests for load_prompt_template."""
+
+    def test_none_path_returns_none(self) -> None:
+        """No path means no template."""
+        assert load_prompt_template(None) is None
+
+    def test_missing_file_returns_none(self, tmp_path) -> None:
+        """A missing file is reported and not cached."""
+        path = tmp_path / "prompt.md"
+        assert load_prompt_template(path) is None
+
+        path.write_text("hello", encoding="utf-8")
+        assert load_prompt_template(path) == "hello"
+
+    def test_edited_file_is_reloaded(self, tmp_path) -> None:
+        """A changed mtime invalidates the cached contents."""
+        path = tmp_path / "prompt.md"
+        path.write_text("  first  \n", encoding="utf-8")
+        os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+        assert load_prompt_template(path) == "first"
+
+        path.write_text("second", encoding="utf-8")
+        os.utime(path, ns=(2_000_000_000, 2_000_000_000))
+        assert load_prompt_template(path) == "second"
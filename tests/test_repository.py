@@ -23,6 +23,8 @@ async def test_get_or_create_user(tmp_path):
         user2 = await repo.get_or_create_user(12345)
         assert user1.id == user2.id
 
+    await db.dispose()
+
 
 @pytest.mark.asyncio
 async def test_token_context_save_and_retrieve(tmp_path):
@@ -54,3 +56,71 @@ async def test_token_context_save_and_retrieve(tmp_path):
         assert len(contexts) > 0
         assert contexts[0].symbol == "TEST"
         assert contexts[0].token_address == "0xabc123"
+
+    await db.dispose()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_connections_use_wal(tmp_path):
+    """SQLite connections should be opened in WAL mode."""
+    from sqlalchemy import text
+
+    db_path = tmp_path / "wal.db"
+    db = Database(f"sqlite+aiosqlite:///{db_path}")
+    db.connect()
+    await db.init_models()
+
+    async with db.session() as session:
+        journal_mode = (await session.execute(text("PRAGMA journal_mode"))).scalar()
+        synchronous = (await session.execute(text("PRAGMA synchronous"))).scalar()
+
+    assert journal_mode == "wal"
+    assert synchronous == 1  # NORMAL
+
+    await db.dispose()
+
+
+@pytest.mark.asyncio
+async def test_in_memory_database_shared_across_sessions():
+    """In-memory SQLite should keep data visible to later sessions."""
+    db = Database("sqlite+aiosqlite:///:memory:")
+    db.connect()
+    await db.init_models()
+
+    async with db.session() as session:
+        user = await Repository(session).get_or_create_user(42)
+
+    async with db.session() as session:
+        fetched = await Repository(session).get_user_by_id(user.id)
+
+    assert fetched is not None
+    assert fetched.chat_id == 42
+
+    await db.dispose()
+
+
+@pytest.mark.asyncio
+async def test_token_context_normalizes_address_case(tmp_path):
+    """Checksum and lowercase variants should map to one context row."""
+    db_path = tmp_path / "context_case.db"
+    db = Database(f"sqlite+aiosqlite:///{db_path}")
+    db.connect()
+    await db.init_models()
+
+    async with db.session() as session:
+        repo = Repository(session)
+        user = await repo.get_or_create_user(77777)
+
+        await repo.save_token_context(
+            user.id, [{"symbol": "OLD", "address": "0xABCdef0123"}]
+        )
+        await repo.save_token_context(
+            user.id, [{"symbol": "NEW", "address": "0xabcdef0123"}]
+        )
+
+        contexts = list(await repo.list_active_token_context(user.id))
+        assert len(contexts) == 1
+        assert contexts[0].token_address == "0xabcdef0123"
+        assert contexts[0].symbol == "NEW"
+
+    await db.dispose()
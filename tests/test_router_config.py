@@ -35,3 +35,41 @@ def test_resolve_router_unknown_network():
     routers = load_router_map()
     with pytest.raises(KeyError):
         resolve_router("sushiswap_v2", "mars-net", routers)
+
+def test_default_routers_are_read_only():
+    """Verify the shared defaults cannot be mutated by callers."""
+    routers = load_router_map()
+    assert routers is DEFAULT_ROUTERS
+    with pytest.raises(TypeError):
+        routers["sushiswap_v2"]["base-mainnet"] = "0x0"
+
+def test_load_router_map_from_file(tmp_path):
+    """Verify that a JSON router file is loaded as read-only network maps."""
+    path = tmp_path / "routers.json"
+    path.write_text('{"custom_v2": {"base-mainnet": "0xabc"}}', encoding="utf-8")
+    routers = load_router_map(path)
+    info = resolve_router("custom_v2", "base-mainnet", routers)
+    assert info.address == "0xabc"
+    with pytest.raises(TypeError):
+        routers["custom_v2"]["base-mainnet"] = "0xdef"
+
+def test_resolve_router_lowercase_address():
+    """Verify that lower=True returns the address in lowercase form."""
+    info = resolve_router("sushiswap_v2", "base-mainnet", load_router_map(), lower=True)
+    assert info.address == "0x6bded42c6da8fbf0d2ba55b2fa120c5e0c8d7891"
+
+    custom = {"custom_v2": {"base-mainnet": "0xABC"}}
+    assert resolve_router("custom_v2", "base-mainnet", custom, lower=True).address == "0xabc"
+
+def test_resolve_router_reuses_default_instances():
+    """Verify that default lookups return the same prebuilt RouterInfo."""
+    routers = load_router_map()
+    first = resolve_router("uniswap_v3", "base-mainnet", routers)
+    assert resolve_router("uniswap_v3", "base-mainnet", routers) is first
+
+def test_load_router_map_rejects_non_object(tmp_path):
+    """Verify that a router file must contain a JSON object."""
+    path = tmp_path / "routers.json"
+    path.write_text('["uniswap_v2"]', encoding="utf-8")
+    with pytest.raises(ValueError):
+        load_router_map(path)
@@ -401,6 +401,17 @@ class TestSwapActivity:
         assert "Aerodrome" in result
         assert "No token data" in result
 
+    def test_format_swap_activity_matches_checksum_honeypot_keys(self) -> None:
+        """Honeypot results keyed by checksum address should still match."""
+        from app.token_card import format_swap_activity
+
+        tokens = [{"baseToken": {"symbol": "PEPE", "address": "0xAbCdEf"}}]
+        honeypot_results = {"0xABCDEF": {"summary": {"verdict": "HONEYPOT"}}}
+
+        result = format_swap_activity(tokens, [], "Uniswap V2", honeypot_results)
+
+        assert "Do not trade" in result
+
 
 class TestSafetyResult:
     """Tests for safety result formatting."""
@@ -3,6 +3,7 @@
 from app.utils.tx_parser import (
     extract_tokens_from_transactions,
     get_swap_direction,
+    iter_tokens_from_transactions,
     _filter_addresses,
 )
 
@@ -141,3 +142,75 @@ class TestExtractTokensFromTransactions:
         # Should only have the valid token, not the 0x...0080
         assert "0x8890de1637912fbbba36b8b19365cdc99122bd6e" in tokens
         assert all("0000000080" not in t for t in tokens)
+
+    def test_extracts_checksummed_raw_input_lowercased(self) -> None:
+        """Mixed-case hex in raw input should yield lowercase addresses."""
+        tx = {
+            "method": "swap",
+            "rawInput": (
+                "0x12345678"
+                "0000000000000000000000008890DE1637912FBBBA36B8B19365CDC99122BD6E"
+            ),
+        }
+        tokens = extract_tokens_from_transactions([tx])
+        assert tokens == ["0x8890de1637912fbbba36b8b19365cdc99122bd6e"]
+
+    def test_ignores_decoded_values_with_trailing_data(self) -> None:
+        """Decoded token fields must be exactly one address."""
+        tx = {
+            "method": "exactInputSingle",
+            "decoded_input": {
+                "tokenIn": "0x8890de1637912fbbba36b8b19365cdc99122bd6e",
+                "tokenOut": "0xdf3c90d5618f8ae66dcaf77f96d7e45393d7c920ffff",
+            },
+        }
+        tokens = extract_tokens_from_transactions([tx])
+        assert tokens == ["0x8890de1637912fbbba36b8b19365cdc99122bd6e"]
+
+    def test_extracts_from_nested_decoded_params(self) -> None:
+        """Token fields inside nested decoded structs should be found."""
+        tx = {
+            "method": "multicall",
+            "decoded_input": {
+                "data": [
+                    {
+                        "params": {
+                            "path": [
+                                "0x8890de1637912fbbba36b8b19365cdc99122bd6e",
+                                "0xDF3C90D5618F8AE66DCAF77F96D7E45393D7C920",
+                            ]
+                        }
+                    }
+                ]
+            },
+        }
+        tokens = extract_tokens_from_transactions([tx])
+        assert sorted(tokens) == [
+            "0x8890de1637912fbbba36b8b19365cdc99122bd6e",
+            "0xdf3c90d5618f8ae66dcaf77f96d7e45393d7c920",
+        ]
+
+    def test_filters_every_default_router(self) -> None:
+        """All configured router addresses should be excluded as non-tokens."""
+        tx = {
+            "method": "swap",
+            "token_transfers": [
+                {"token_address": "0x6fF5693b99212Da76ad316178A184AB56D299b43"},
+                {"token_address": "0x6BDED42c6DA8FBf0d2bA55B2fa120C5e0c8D7891"},
+                {"token_address": "0x8890de1637912fbbba36b8b19365cdc99122bd6e"},
+            ],
+        }
+        tokens = extract_tokens_from_transactions([tx])
+        assert tokens == ["0x8890de1637912fbbba36b8b19365cdc99122bd6e"]
+
+    def test_iter_tokens_yields_in_transaction_order(self) -> None:
+        """The iterator should yield each token once, first transaction first."""
+        first = "0x8890de1637912fbbba36b8b19365cdc99122bd6e"
+        second = "0xdf3c90d5618f8ae66dcaf77f96d7e45393d7c920"
+        txs = [
+            {"token_transfers": [{"token_address": first}]},
+            {"token_transfers": [{"token_address": first}, {"tokenAddress": second}]},
+        ]
+        tokens = iter_tokens_from_transactions(txs)
+        assert next(tokens) == first
+        assert list(tokens) == [second]